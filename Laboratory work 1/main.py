@@ -1,6 +1,67 @@
-def SumTwo(a, b):
-    if type(b) is not int or any(type(x) is not int for x in a):
-        return None
+import argparse
+import bisect
+import itertools
+import mmap
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import timeit
+from array import array
+from multiprocessing import shared_memory, util
+
+try:
+    import numpy as np
+except ImportError:  # векторизованный метод недоступен, остальные работают
+    np = None
+
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+_INT_FORMATS = frozenset("bBhHiIlLqQnN")
+
+
+def _is_int_buffer(a):
+    """Проверить, что a — типизированный буфер целых (ndarray, array, memoryview).
+
+    Для таких объектов тип элементов гарантирован dtype/форматом, поэтому
+    поэлементная проверка type(x) не нужна.
+    """
+    if np is not None and isinstance(a, np.ndarray):
+        return a.ndim == 1 and a.dtype.kind in "iu"
+    if isinstance(a, (list, tuple)):
+        return False
+    try:
+        view = memoryview(a)
+    except TypeError:
+        return False
+    return view.ndim == 1 and view.format.lstrip("@=<>!") in _INT_FORMATS
+
+
+def _is_valid_input(a, b):
+    """Проверить входные данные SumTwo: b и все элементы a — int."""
+    if type(b) is not int:
+        return False
+    return _is_int_buffer(a) or not any(type(x) is not int for x in a)
+
+
+def _to_int_list(a):
+    """Типизированный буфер целых -> список int Python; остальное без изменений.
+
+    Арифметика над элементами ndarray/array идёт в фиксированной ширине
+    (int8, int64, ...) и может переполниться или «завернуться»; все движки,
+    кроме "numpy" (он сам проверяет диапазон), работают со списком int.
+    """
+    if np is not None and isinstance(a, np.ndarray):
+        return a.tolist()
+    if _is_int_buffer(a):
+        return memoryview(a).tolist()
+    return a
+
+
+def _sum_two_brute(a, b):
+    """Полный перебор пар (i, j): O(n²)."""
     for i in range(len(a)):
         for j in range(i+1,len(a)):
             if a[i] + a[j] == b:
@@ -9,7 +70,858 @@ def SumTwo(a, b):
                 continue
     return None
 
+
+def _index_occurrences(values):
+    """Запомнить первое и второе вхождение каждого значения за один проход.
+
+    Returns:
+        (first, second): словари значение -> индекс.
+    """
+    first = {}
+    second = {}
+    for idx, x in enumerate(values):
+        if x not in first:
+            first[x] = idx
+        elif x not in second:
+            second[x] = idx
+    return first, second
+
+
+def _first_pair(values, first, second, b):
+    """Найти первую пару [i, j] по таблицам вхождений из _index_occurrences.
+
+    i перебирается по возрастанию: для первого подходящего i дополнение
+    b - a[i] не может встречаться раньше i (иначе пара нашлась бы на меньшем i),
+    поэтому наименьший j — это первое вхождение дополнения или, если
+    дополнение равно a[i], второе вхождение a[i].
+    """
+    for i, x in enumerate(values):
+        c = b - x
+        if c != x:
+            j = first.get(c, -1)
+            if j > i:
+                return [i, j]
+        elif first[x] == i and x in second:
+            return [i, second[x]]
+    return None
+
+
+def _sum_two_hash(a, b):
+    """Поиск пары через словарь значение -> индекс: O(n)."""
+    first, second = _index_occurrences(a)
+    return _first_pair(a, first, second, b)
+
+
+def _as_int64_array(a):
+    """Представить a как одномерный массив int64 (без копирования, где возможно).
+
+    Returns:
+        np.ndarray или None, если значения не помещаются в int64.
+    """
+    if isinstance(a, np.ndarray):
+        arr = a
+    elif _is_int_buffer(a):
+        view = memoryview(a)
+        arr = np.frombuffer(view, dtype=np.dtype(view.format))
+    else:
+        try:
+            arr = np.asarray(a, dtype=np.int64)
+        except OverflowError:
+            return None
+    if arr.dtype == np.uint64 and arr.size and int(arr.max()) > _INT64_MAX:
+        return None
+    return arr.astype(np.int64, copy=False)
+
+
+def _sum_two_numpy(a, b):
+    """Векторизованный поиск пары: argsort + searchsorted, O(n log n).
+
+    Для каждого i бинарным поиском находится группа равных дополнению
+    b - a[i] значений в отсортированном массиве. Сортировка устойчивая,
+    поэтому индексы внутри группы возрастают: последний из них показывает,
+    есть ли j > i, а наименьший такой j ищется в группе первого подходящего i.
+    Если NumPy недоступен или значения выходят за int64 — используется "hash".
+    """
+    arr = _as_int64_array(a) if np is not None else None
+    if arr is None:
+        return _sum_two_hash(a, b)
+    n = len(arr)
+    if n < 2:
+        return None
+    lo_v, hi_v = int(arr.min()), int(arr.max())
+    if not _INT64_MIN <= b <= _INT64_MAX or b - hi_v < _INT64_MIN or b - lo_v > _INT64_MAX:
+        return _sum_two_hash(arr.tolist(), b)
+
+    order = np.argsort(arr, kind="stable")
+    ordered = arr[order]
+    comp = np.int64(b) - arr
+    lo = np.searchsorted(ordered, comp, side="left")
+    hi = np.searchsorted(ordered, comp, side="right")
+    last = order[np.maximum(hi - 1, 0)]
+    mask = (hi > lo) & (last > np.arange(n))
+    if not mask.any():
+        return None
+    i = int(np.argmax(mask))
+    group = order[lo[i]:hi[i]]
+    j = int(group[np.searchsorted(group, i, side="right")])
+    return [i, j]
+
+
+_METHODS = {
+    "brute": _sum_two_brute,
+    "hash": _sum_two_hash,
+    "numpy": _sum_two_numpy,
+}
+
+
+def SumTwo(a, b, method="hash"):
+    """Найти индексы [i, j] (i < j) двух элементов a с суммой b.
+
+    Возвращается первая пара в порядке вложенного перебора: наименьший i,
+    затем наименьший j.
+
+    Args:
+        a: Список целых чисел либо типизированный буфер целых
+            (numpy.ndarray, array('q'), memoryview) — для буфера
+            поэлементная проверка типов пропускается.
+        b: Целевая сумма (int).
+        method: "hash" (словарь, O(n)), "brute" (перебор пар, O(n²))
+            или "numpy" (векторизованный поиск, O(n log n)).
+
+    Returns:
+        [i, j] или None, если пары нет, входные данные некорректны
+        либо метод неизвестен.
+    """
+    if not _is_valid_input(a, b):
+        return None
+    engine = _METHODS.get(method)
+    if engine is None:
+        return None
+    if engine is not _sum_two_numpy:
+        a = _to_int_list(a)
+    return engine(a, b)
+
+
+def _iter_pairs(a, b):
+    positions = {}
+    for idx, x in enumerate(a):
+        positions.setdefault(x, []).append(idx)
+    for i, x in enumerate(a):
+        js = positions.get(b - x)
+        if js is None:
+            continue
+        for k in range(bisect.bisect_right(js, i), len(js)):
+            yield i, js[k]
+
+
+def iter_pairs(a, b):
+    """Лениво перечислить все пары (i, j), i < j, с a[i] + a[j] == b.
+
+    Порядок — как у вложенного перебора SumTwo (по i, затем по j). Хранится
+    только словарь значение -> список индексов (O(n)); пары не накапливаются,
+    время — O(n log n + число пар).
+
+    Returns:
+        Генератор пар или None, если входные данные некорректны.
+    """
+    if not _is_valid_input(a, b):
+        return None
+    return _iter_pairs(_to_int_list(a), b)
+
+
+def count_pairs(a, b):
+    """Число пар (i, j), i < j, с a[i] + a[j] == b, без построения самих пар: O(n).
+
+    Returns:
+        int или None, если входные данные некорректны.
+    """
+    if not _is_valid_input(a, b):
+        return None
+    seen = {}
+    total = 0
+    for x in _to_int_list(a):
+        total += seen.get(b - x, 0)
+        seen[x] = seen.get(x, 0) + 1
+    return total
+
+
+def _pair_from(a, b, start):
+    """Первая пара (i, j), start <= i < j, с суммой b (метод "hash" на суффиксе)."""
+    suffix = a[start:]
+    first, second = _index_occurrences(suffix)
+    pair = _first_pair(suffix, first, second, b)
+    return None if pair is None else (pair[0] + start, pair[1] + start)
+
+
+def _triple_from(a, b, start, ordered):
+    """Первая тройка индексов >= start: для каждого i — два указателя по ordered.
+
+    ordered — пары (значение, индекс), отсортированные по значению.
+    Указатели пропускают индексы <= i; наличие пары проверяется за O(n),
+    после чего наименьшая пара (j, k) для найденного i ищется через _pair_from.
+    Итого O(n²).
+    """
+    n = len(a)
+    for i in range(start, n):
+        t = b - a[i]
+        lo, hi = 0, len(ordered) - 1
+        while True:
+            while lo < hi and ordered[lo][1] <= i:
+                lo += 1
+            while lo < hi and ordered[hi][1] <= i:
+                hi -= 1
+            if lo >= hi:
+                break
+            s = ordered[lo][0] + ordered[hi][0]
+            if s == t:
+                return (i,) + _pair_from(a, t, i + 1)
+            if s < t:
+                lo += 1
+            else:
+                hi -= 1
+    return None
+
+
+def _k_sum_from(a, b, k, start, ordered):
+    """Лексикографически первый набор из k индексов >= start с суммой b.
+
+    k=1, 2 — прямой поиск, k=3 — два указателя, k>=4 — встреча посередине:
+    для всех наборов из правой половины (k - k//2 индексов) запоминается
+    наибольший первый индекс по каждой сумме, затем наборы левой половины
+    перебираются в лексикографическом порядке, и первый, для которого
+    дополнение достижимо правее его последнего индекса, достраивается
+    рекурсивно. Время и память — O(n^ceil(k/2)).
+    """
+    n = len(a)
+    if k == 1:
+        for i in range(start, n):
+            if a[i] == b:
+                return (i,)
+        return None
+    if k == 2:
+        return _pair_from(a, b, start)
+    if k == 3:
+        return _triple_from(a, b, start, ordered)
+
+    left_k = k // 2
+    right_k = k - left_k
+    max_first = {}
+    for combo in itertools.combinations(range(start, n), right_k):
+        max_first[sum(a[i] for i in combo)] = combo[0]
+    for combo in itertools.combinations(range(start, n), left_k):
+        s = sum(a[i] for i in combo)
+        if max_first.get(b - s, -1) > combo[-1]:
+            return combo + _k_sum_from(a, b - s, right_k, combo[-1] + 1, ordered)
+    return None
+
+
+def k_sum(a, b, k):
+    """Найти k индексов i1 < i2 < ... < ik, сумма элементов которых равна b.
+
+    Возвращается лексикографически первый набор — тот же, что дал бы
+    вложенный перебор; для k=2 совпадает с SumTwo. Проверка входных данных
+    та же, что у SumTwo.
+
+    Args:
+        a: Список целых чисел (или типизированный буфер целых).
+        b: Целевая сумма (int).
+        k: Размер набора (int >= 1).
+
+    Returns:
+        Кортеж индексов или None, если набора нет либо входные данные некорректны.
+    """
+    if type(k) is not int or k < 1 or not _is_valid_input(a, b):
+        return None
+    a = list(_to_int_list(a))
+    if k > len(a):
+        return None
+    ordered = sorted((x, i) for i, x in enumerate(a)) if k >= 3 else []
+    return _k_sum_from(a, b, k, 0, ordered)
+
+
+class PairSumIndex:
+    """Индекс для многократного поиска пар с разными суммами по одному массиву.
+
+    При построении массив проверяется один раз, различные значения
+    сортируются вместе с первым и вторым индексом вхождения (O(n log n)).
+    Каждый запрос query(b) — проход двумя указателями по различным
+    значениям (O(d), d — число различных значений) и возвращает тот же
+    результат, что SumTwo(a, b).
+    """
+
+    def __init__(self, a):
+        self.valid = _is_valid_input(a, 0)
+        self._values = []
+        self._first = []
+        self._second = []
+        if not self.valid:
+            return
+        first, second = _index_occurrences(_to_int_list(a))
+        self._values = sorted(first)
+        self._first = [first[x] for x in self._values]
+        self._second = [second.get(x, -1) for x in self._values]
+
+    def query(self, b):
+        """Найти [i, j] для суммы b (как SumTwo) или None."""
+        if not self.valid or type(b) is not int:
+            return None
+        values, first, second = self._values, self._first, self._second
+        best = None
+        lo, hi = 0, len(values) - 1
+        while lo <= hi:
+            s = values[lo] + values[hi]
+            if s < b:
+                lo += 1
+            elif s > b:
+                hi -= 1
+            else:
+                if lo == hi:
+                    cand = [first[lo], second[lo]] if second[lo] != -1 else None
+                else:
+                    i, j = first[lo], first[hi]
+                    cand = [i, j] if i < j else [j, i]
+                if cand is not None and (best is None or cand < best):
+                    best = cand
+                lo += 1
+                hi -= 1
+        return best
+
+    def query_many(self, bs):
+        """Ответить на пакет запросов: список результатов query(b)."""
+        return [self.query(b) for b in bs]
+
+
+class OnlinePairSum:
+    """Изменяемый массив с поиском пары по контракту SumTwo.
+
+    Элементы хранятся по «слотам» в порядке добавления; удалённые слоты
+    помечаются, а дерево Фенвика по флагам живых слотов переводит слот
+    в текущий индекс и обратно за O(log n). Для каждого значения хранится
+    отсортированный список его живых слотов. Когда мёртвых слотов
+    становится больше половины, хранилище уплотняется (_compact), поэтому
+    память и высота дерева зависят от числа живых элементов, а не от
+    общего числа добавлений.
+
+    Сложность: append — O(log n), remove_at — амортизированно O(log n)
+    (плюс сдвиг в списке слотов одного значения), find(b) — O(d + log n),
+    где d — число различных значений (вместо O(n²) у полного перебора).
+
+    find сознательно не O(1)/O(log n): ответ — лексикографически первая
+    пара, как у SumTwo, а после каждого append/remove_at она может
+    смениться у любой из O(d) пар значений. Держать готовый ответ для
+    каждого b пришлось бы пересчётом на каждое изменение; вместо этого
+    find просматривает различные значения, а индексы переводит деревом.
+    """
+
+    # Уплотнение не запускается на маленьких хранилищах
+    _COMPACT_MIN_SLOTS = 64
+
+    def __init__(self, a=()):
+        self.valid = _is_valid_input(a, 0)
+        self._values = []
+        self._alive = bytearray()
+        self._tree = [0]
+        self._slots = {}
+        self._size = 0
+        if self.valid:
+            for x in _to_int_list(a):
+                self.append(x)
+
+    def __len__(self):
+        return self._size
+
+    def _prefix(self, slot):
+        """Число живых слотов среди 0..slot включительно."""
+        total = 0
+        k = slot + 1
+        tree = self._tree
+        while k > 0:
+            total += tree[k]
+            k &= k - 1
+        return total
+
+    def _update(self, slot, delta):
+        k = slot + 1
+        tree = self._tree
+        while k < len(tree):
+            tree[k] += delta
+            k += k & -k
+
+    def _slot_at(self, index):
+        """Слот живого элемента с текущим индексом index (спуск по дереву)."""
+        pos = 0
+        rest = index + 1
+        tree = self._tree
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(tree) and tree[nxt] < rest:
+                pos = nxt
+                rest -= tree[nxt]
+            step >>= 1
+        return pos
+
+    def append(self, x):
+        """Добавить x в конец. Возвращает его индекс или None для не-int."""
+        if not self.valid or type(x) is not int:
+            return None
+        slot = len(self._values)
+        self._values.append(x)
+        self._alive.append(1)
+        k = slot + 1
+        low = k & -k
+        self._tree.append(1 + self._prefix(slot - 1) - self._prefix(k - low - 1))
+        self._slots.setdefault(x, []).append(slot)
+        self._size += 1
+        return self._size - 1
+
+    def remove_at(self, index):
+        """Удалить элемент с индексом index (как list.pop). Возвращает его значение.
+
+        Returns:
+            Удалённое значение или None, если индекс некорректен.
+        """
+        if not self.valid or type(index) is not int or not 0 <= index < self._size:
+            return None
+        slot = self._slot_at(index)
+        x = self._values[slot]
+        self._alive[slot] = 0
+        self._update(slot, -1)
+        slots = self._slots[x]
+        del slots[bisect.bisect_left(slots, slot)]
+        if not slots:
+            del self._slots[x]
+        self._size -= 1
+        dead = len(self._values) - self._size
+        if dead > self._size and len(self._values) >= self._COMPACT_MIN_SLOTS:
+            self._compact()
+        return x
+
+    def _compact(self):
+        """Убрать мёртвые слоты: перенумеровать живые и перестроить дерево за O(n)."""
+        values = self.to_list()
+        n = len(values)
+        tree = [0] + [1] * n
+        for k in range(1, n + 1):
+            parent = k + (k & -k)
+            if parent <= n:
+                tree[parent] += tree[k]
+        slots = {}
+        for slot, x in enumerate(values):
+            slots.setdefault(x, []).append(slot)
+        self._values = values
+        self._alive = bytearray(b"\x01") * n
+        self._tree = tree
+        self._slots = slots
+
+    def find(self, b):
+        """Найти [i, j] для суммы b по текущему содержимому (как SumTwo) или None."""
+        if not self.valid or type(b) is not int:
+            return None
+        best = None
+        slots = self._slots
+        for x, own in slots.items():
+            c = b - x
+            if c < x:
+                continue
+            if c == x:
+                if len(own) < 2:
+                    continue
+                cand = (own[0], own[1])
+            else:
+                other = slots.get(c)
+                if other is None:
+                    continue
+                i, j = own[0], other[0]
+                cand = (i, j) if i < j else (j, i)
+            if best is None or cand < best:
+                best = cand
+        if best is None:
+            return None
+        return [self._prefix(best[0]) - 1, self._prefix(best[1]) - 1]
+
+    def to_list(self):
+        """Текущее содержимое в виде списка."""
+        return [x for x, alive in zip(self._values, self._alive) if alive]
+
+
+def benchmark_online(n=2000, ops=2000, seed=0):
+    """Пропускная способность OnlinePairSum на смеси append/remove_at/find.
+
+    Та же последовательность операций прогоняется на обычном списке
+    с вызовом SumTwo на каждый find.
+
+    Returns:
+        dict: 'online_ops_per_sec' и 'sumtwo_ops_per_sec'.
+    """
+    rnd = random.Random(seed)
+    start = [rnd.randint(-n, n) for _ in range(n)]
+    script = []
+    size = n
+    for _ in range(ops):
+        kind = rnd.randrange(3)
+        if kind == 0 or size == 0:
+            script.append(("append", rnd.randint(-n, n)))
+            size += 1
+        elif kind == 1:
+            script.append(("remove_at", rnd.randrange(size)))
+            size -= 1
+        else:
+            script.append(("find", rnd.randint(-2 * n, 2 * n)))
+
+    def run_online():
+        s = OnlinePairSum(start)
+        for op, arg in script:
+            getattr(s, op)(arg)
+
+    def run_list():
+        a = list(start)
+        for op, arg in script:
+            if op == "append":
+                a.append(arg)
+            elif op == "remove_at":
+                a.pop(arg)
+            else:
+                SumTwo(a, arg)
+
+    t_online = min(timeit.repeat(run_online, repeat=3, number=1))
+    t_list = min(timeit.repeat(run_list, repeat=3, number=1))
+    return {"online_ops_per_sec": ops / t_online, "sumtwo_ops_per_sec": ops / t_list}
+
+
+def _iter_file_values(path, chunk_size=1 << 16, use_mmap=False, start=0):
+    """Лениво прочитать int64-значения (нативный порядок байт) из файла.
+
+    Чтение начинается со значения с индексом start. Одновременно в памяти
+    держится не больше chunk_size значений (при use_mmap — окно
+    отображённого файла того же размера).
+    """
+    with open(path, "rb") as f:
+        if use_mmap:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm).cast("q")
+                try:
+                    for pos in range(start, len(view), chunk_size):
+                        yield from view[pos:pos + chunk_size]
+                finally:
+                    view.release()
+            return
+        chunk = array("q")
+        f.seek(start * chunk.itemsize)
+        while True:
+            data = f.read(chunk_size * chunk.itemsize)
+            if not data:
+                return
+            chunk = array("q", data)
+            yield from chunk
+
+
+def sum_two_file(path, b, chunk_size=1 << 16, use_mmap=False):
+    """Найти первую пару [i, j] в бинарном файле int64 без загрузки его в список.
+
+    Кандидаты i берутся блоками по chunk_size значений. Для блока строится
+    словарь «нужное дополнение -> наименьший i блока», затем файл читается
+    от начала блока и для каждого дополнения фиксируется первый j > i.
+    Первый блок, в котором нашлась пара, даёт ответ. Память — O(chunk_size)
+    независимо от размера файла и числа различных значений; платой служат
+    до n / chunk_size проходов по файлу (O(n^2 / chunk_size) чтений в худшем
+    случае, когда пары нет). Результат совпадает с SumTwo на тех же данных.
+
+    Args:
+        path: Путь к файлу с int64 в нативном порядке байт.
+        b: Целевая сумма (int).
+        chunk_size: Размер блока кандидатов и порции чтения, в значениях.
+        use_mmap: Читать через отображение файла в память.
+
+    Returns:
+        [i, j] или None, если пары нет, b не int, chunk_size некорректен
+        либо размер файла не кратен 8 байтам.
+    """
+    if type(b) is not int or type(chunk_size) is not int or chunk_size < 1:
+        return None
+    size = os.path.getsize(path)
+    if size == 0 or size % array("q").itemsize:
+        return None
+    n = size // array("q").itemsize
+    for block_start in range(0, n, chunk_size):
+        block = _iter_file_values(path, chunk_size, use_mmap, block_start)
+        need = {}
+        for i, x in enumerate(itertools.islice(block, chunk_size), block_start):
+            need.setdefault(b - x, i)
+        block.close()
+        order = list(need)  # дополнения по возрастанию своего i
+        pending = 0
+        best = None
+        values = _iter_file_values(path, chunk_size, use_mmap, block_start)
+        for j, x in enumerate(values, block_start):
+            i = need.get(x)
+            if i is None or i >= j:
+                continue
+            # первый j > i для этого дополнения — наименьший для его i
+            del need[x]
+            if best is None or i < best[0]:
+                best = [i, j]
+            while pending < len(order) and order[pending] not in need:
+                pending += 1
+            if pending == len(order) or need[order[pending]] > best[0]:
+                break  # меньших необработанных i не осталось
+        values.close()
+        if best is not None:
+            return best
+    return None
+
+
+def _peak_rss_kb():
+    """Пиковый RSS текущего процесса, КиБ (None, если недоступно)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+# Параллельный поиск
+
+_worker_state = {}
+
+
+def _to_int64_bytes(a):
+    """Байтовое представление a как массива int64 или None, если не помещается."""
+    if np is not None and isinstance(a, np.ndarray):
+        arr = _as_int64_array(a)
+        return None if arr is None else memoryview(np.ascontiguousarray(arr)).cast("B")
+    if _is_int_buffer(a) and memoryview(a).format.lstrip("@=") == "q":
+        return memoryview(a).cast("B")
+    try:
+        return memoryview(array("q", a)).cast("B")
+    except OverflowError:
+        return None
+
+
+_MASK64 = (1 << 64) - 1
+_MIX64 = 0x9E3779B97F4A7C15
+
+
+def _pair_class(x, b, n_classes):
+    """Класс элемента x: у обоих элементов пары с суммой b он одинаков.
+
+    Ключ пары — min(x, b - x); он перемешивается мультипликативным хешем,
+    чтобы классы были равномерны и на данных с постоянным шагом.
+    """
+    key = min(x, b - x) & _MASK64
+    return (((key * _MIX64) & _MASK64) >> 32) % n_classes
+
+
+def _init_worker(shm_name, n, best_i):
+    """Инициализатор процесса пула: подключиться к общему массиву."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_state["shm"] = shm
+    _worker_state["view"] = shm.buf[:n * 8].cast("q")
+    _worker_state["best"] = best_i
+    util.Finalize(None, _close_worker, exitpriority=0)
+
+
+def _close_worker():
+    """Финализатор процесса пула: отпустить представление и закрыть общую память."""
+    _worker_state.pop("view").release()
+    _worker_state.pop("shm").close()
+
+
+def _class_members(view, b, cls, n_classes):
+    """Индексы и значения элементов массива, попавших в класс cls."""
+    if np is not None:
+        arr = np.frombuffer(view, dtype=np.int64)
+        key = np.minimum(arr, np.int64(b) - arr).astype(np.uint64)
+        mixed = (key * np.uint64(_MIX64)) >> np.uint64(32)
+        idx = np.flatnonzero(mixed % np.uint64(n_classes) == cls)
+        return idx.tolist(), arr[idx].tolist()
+    idx = [i for i, x in enumerate(view) if _pair_class(x, b, n_classes) == cls]
+    return idx, [view[i] for i in idx]
+
+
+def _scan_class(task):
+    """Найти первую пару среди элементов одного класса _pair_class.
+
+    Пары бывают только внутри класса, а индексы класса возрастают, поэтому
+    первая пара подпоследовательности — первая пара класса. Таблица
+    «дополнение -> наименьшая позиция i» строится по возрастанию индексов
+    и только до уже найденного другим процессом i; затем по классу ищется
+    первый j > i для каждого дополнения. Оба прохода прерываются, как только
+    не осталось кандидатов i меньше найденного (здесь или в другом процессе).
+    """
+    cls, n_classes, b = task
+    best = _worker_state["best"]
+    idx, values = _class_members(_worker_state["view"], b, cls, n_classes)
+    need = {}
+    for pos, x in enumerate(values):
+        if not pos & 0xFFF and best.value < idx[pos]:
+            break
+        need.setdefault(b - x, pos)
+    order = list(need)  # дополнения по возрастанию своей позиции i
+    pending = 0
+    found = None
+    for j, x in enumerate(values):
+        if not j & 0xFFF:
+            while pending < len(order) and order[pending] not in need:
+                pending += 1
+            if pending == len(order) or best.value < idx[need[order[pending]]]:
+                break
+        i = need.get(x)
+        if i is None or i >= j:
+            continue
+        del need[x]
+        if found is None or i < found[0]:
+            found = [i, j]
+        while pending < len(order) and order[pending] not in need:
+            pending += 1
+        if pending == len(order) or need[order[pending]] > found[0]:
+            break
+    if found is None:
+        return None
+    i = idx[found[0]]
+    with best.get_lock():
+        if i < best.value:
+            best.value = i
+    return [i, idx[found[1]]]
+
+
+def sum_two_parallel(a, b, workers=None):
+    """Найти пару [i, j] как SumTwo, распределив поиск по процессам.
+
+    Массив один раз копируется в multiprocessing.shared_memory как int64.
+    Элементы делятся на классы по ключу min(x, b - x): оба элемента любой
+    пары попадают в один класс, и каждый процесс ищет первую пару только
+    в своём классе (O(n / workers) операций со словарём плюс векторный
+    отбор класса через NumPy, если он доступен). Ответ — пара
+    с наименьшим i; найденный i публикуется в общей переменной, и процессы,
+    ушедшие дальше него, прекращают поиск.
+
+    Args:
+        a: Список целых чисел или типизированный буфер целых.
+        b: Целевая сумма (int).
+        workers: Число процессов (по умолчанию os.cpu_count()).
+
+    Returns:
+        [i, j] или None, если пары нет либо входные данные некорректны.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if type(workers) is not int or workers < 1 or not _is_valid_input(a, b):
+        return None
+    n = len(a)
+    if n < 2:
+        return None
+    data = _to_int64_bytes(a)
+    if data is None or not _INT64_MIN <= b <= _INT64_MAX:
+        return _sum_two_hash(list(_to_int_list(a)), b)
+    values = memoryview(data).cast("q")
+    if b - max(values) < _INT64_MIN or b - min(values) > _INT64_MAX:
+        return _sum_two_hash(values.tolist(), b)
+
+    ctx = multiprocessing.get_context()
+    shm = shared_memory.SharedMemory(create=True, size=len(data))
+    try:
+        shm.buf[:len(data)] = data
+        best_i = ctx.Value("q", n)
+        with ctx.Pool(workers, initializer=_init_worker,
+                      initargs=(shm.name, n, best_i)) as pool:
+            results = pool.map(_scan_class, [(c, workers, b) for c in range(workers)])
+    finally:
+        shm.close()
+        shm.unlink()
+    found = [r for r in results if r is not None]
+    return min(found) if found else None
+
+
+def benchmark_parallel(n=1_000_000, workers=None, seed=0):
+    """Масштабирование sum_two_parallel по числу процессов 1, 2, 4, ..., N.
+
+    Пара помещается в конец массива — худший случай для раннего останова.
+
+    Returns:
+        dict: число процессов -> время одного поиска, с.
+    """
+    max_workers = workers or os.cpu_count() or 1
+    rnd = random.Random(seed)
+    a = array("q", (rnd.randrange(1, 1 << 40) for _ in range(n)))
+    a[-2], a[-1] = -5, -7
+    counts = []
+    w = 1
+    while w < max_workers:
+        counts.append(w)
+        w *= 2
+    counts.append(max_workers)
+    return {
+        w: min(timeit.repeat(lambda: sum_two_parallel(a, -12, w), repeat=3, number=1))
+        for w in counts
+    }
+
+
+def benchmark_pair_index(a, bs, repeat=5):
+    """Отдельно измерить построение PairSumIndex и ответы на запросы.
+
+    Returns:
+        dict: 'build_ms' — построение индекса, 'query_ms' — все запросы bs,
+        'sumtwo_ms' — те же запросы через повторные вызовы SumTwo
+        (медианы, мс).
+    """
+    index = PairSumIndex(a)
+    build = timeit.repeat(lambda: PairSumIndex(a), repeat=repeat, number=1)
+    query = timeit.repeat(lambda: index.query_many(bs), repeat=repeat, number=1)
+    plain = timeit.repeat(lambda: [SumTwo(a, b) for b in bs], repeat=repeat, number=1)
+    return {
+        "build_ms": 1000.0 * statistics.median(build),
+        "query_ms": 1000.0 * statistics.median(query),
+        "sumtwo_ms": 1000.0 * statistics.median(plain),
+    }
+
+
+def benchmark_methods(a, b, repeat=5):
+    """Сравнить методы SumTwo на одних и тех же данных.
+
+    Returns:
+        dict: метод -> медианное время одного вызова, мс.
+    """
+    return {
+        method: 1000.0 * statistics.median(
+            timeit.repeat(lambda: SumTwo(a, b, method), repeat=repeat, number=1)
+        )
+        for method in _METHODS
+    }
+
+
+def main(argv=None):
+    """Точка входа: демонстрация либо поиск пары в файле (--file, --target)."""
+    parser = argparse.ArgumentParser(description="Сумма двух")
+    parser.add_argument("--file", help="бинарный файл int64 для потокового поиска")
+    parser.add_argument("--target", type=int, help="целевая сумма b")
+    parser.add_argument("--chunk-size", type=int, default=1 << 16,
+                        help="размер порции чтения, в значениях")
+    parser.add_argument("--mmap", action="store_true", help="читать файл через mmap")
+    parser.add_argument("--bench-parallel", type=int, metavar="N",
+                        help="замерить sum_two_parallel на массиве из N элементов")
+    args = parser.parse_args(argv)
+
+    if args.bench_parallel is not None:
+        for w, t in benchmark_parallel(args.bench_parallel).items():
+            print(f"{w:3d} процесс(ов): {t:.3f} с")
+        return
+
+    if args.file is None:
+        print(SumTwo([2, 7, 11, 15], 9))
+        print(SumTwo([3, 2, 4], 6))
+        print(SumTwo([3, 3], 6))
+        print(benchmark_methods(list(range(2000)), -1, repeat=3))
+        print(benchmark_pair_index(list(range(0, 20000, 3)), list(range(1000)), repeat=3))
+        print(benchmark_online())
+        return
+    if args.target is None:
+        parser.error("--target обязателен вместе с --file")
+
+    print(sum_two_file(args.file, args.target, args.chunk_size, args.mmap))
+    print(f"Пиковый RSS: {_peak_rss_kb()} КиБ")
+
+
 if __name__ == "__main__":
-    print(SumTwo([2, 7, 11, 15], 9))
-    print(SumTwo([3, 2, 4], 6))
-    print(SumTwo([3, 3], 6))
+    main()
@@ -1,5 +1,21 @@
+import itertools
+import os
+import random
+import tempfile
 import unittest
-from main import SumTwo
+from array import array
+
+from main import (
+    OnlinePairSum,
+    PairSumIndex,
+    SumTwo,
+    count_pairs,
+    iter_pairs,
+    k_sum,
+    np,
+    sum_two_file,
+    sum_two_parallel,
+)
 
 class TestSumTwo(unittest.TestCase):
     def test_example_1(self):
@@ -53,5 +69,249 @@ class TestSumTwo(unittest.TestCase):
         self.assertIsNone(SumTwo([2, 7, 11, 15], 9.0))
         self.assertIsNone(SumTwo([3, 2, 4], 6.0))
 
+    def test_brute_method_matches_examples(self):
+        self.assertEqual(SumTwo([2,7,11,15], 9, method="brute"), [0, 1])
+        self.assertEqual(SumTwo([1,2,3,4], 5, method="brute"), [0, 3])
+
+    def test_hash_matches_brute_random(self):
+        rnd = random.Random(1)
+        for _ in range(300):
+            a = [rnd.randint(-10, 10) for _ in range(rnd.randint(0, 15))]
+            b = rnd.randint(-20, 20)
+            self.assertEqual(SumTwo(a, b, method="hash"), SumTwo(a, b, method="brute"))
+
+    def test_unknown_method_returns_none(self):
+        self.assertIsNone(SumTwo([2,7,11,15], 9, method="unknown"))
+
+
+class TestSumTwoTypedBuffers(unittest.TestCase):
+    def test_array_buffer_accepted(self):
+        a = array("q", [2, 7, 11, 15])
+        self.assertEqual(SumTwo(a, 9), [0, 1])
+        self.assertEqual(SumTwo(a, 9, method="numpy"), [0, 1])
+
+    def test_float_buffer_rejected(self):
+        self.assertIsNone(SumTwo(array("d", [2, 7]), 9))
+
+    @unittest.skipUnless(np is not None, "numpy не установлен")
+    def test_numpy_matches_brute_random(self):
+        rnd = random.Random(3)
+        for _ in range(300):
+            a = [rnd.randint(-10, 10) for _ in range(rnd.randint(0, 15))]
+            b = rnd.randint(-20, 20)
+            expected = SumTwo(a, b, method="brute")
+            self.assertEqual(SumTwo(a, b, method="numpy"), expected)
+            self.assertEqual(SumTwo(np.array(a, dtype=np.int64), b, method="numpy"), expected)
+            self.assertEqual(SumTwo(np.array(a, dtype=np.int8), b, method="numpy"), expected)
+
+    @unittest.skipUnless(np is not None, "numpy не установлен")
+    def test_numpy_large_values(self):
+        a = np.array([2 ** 62, 5, 2 ** 62], dtype=np.int64)
+        self.assertEqual(SumTwo(a, 2 ** 63, method="numpy"), [0, 2])
+        self.assertEqual(SumTwo([10**20, 1, 2], 3, method="numpy"), [1, 2])
+
+    @unittest.skipUnless(np is not None, "numpy не установлен")
+    def test_fixed_width_values_do_not_overflow(self):
+        """Сумма считается в int Python для всех методов и API, а не в ширине буфера."""
+        small = np.array([100, 100], dtype=np.int8)
+        edge = np.array([2 ** 63 - 1, 2 ** 63 - 1], dtype=np.int64)
+        for method in ("hash", "brute", "numpy"):
+            self.assertEqual(SumTwo(small, 200, method=method), [0, 1])
+            self.assertIsNone(SumTwo(edge, -2, method=method))
+            self.assertEqual(SumTwo(edge, 2 ** 64 - 2, method=method), [0, 1])
+        self.assertEqual(SumTwo(small, 200), [0, 1])
+        self.assertIsNone(SumTwo(edge, -2))
+        self.assertIsNone(PairSumIndex(edge).query(-2))
+        self.assertEqual(PairSumIndex(small).query(200), [0, 1])
+        self.assertEqual(count_pairs(edge, -2), 0)
+        self.assertEqual(list(iter_pairs(small, 200)), [(0, 1)])
+        self.assertIsNone(k_sum(edge, -2, 2))
+        self.assertIsNone(OnlinePairSum(edge).find(-2))
+        self.assertIsNone(SumTwo(array("b", [100, 100]), -56))
+        self.assertEqual(SumTwo(array("b", [100, 100]), 200), [0, 1])
+
+    @unittest.skipUnless(np is not None, "numpy не установлен")
+    def test_numpy_float_array_rejected(self):
+        self.assertIsNone(SumTwo(np.array([2.0, 7.0]), 9, method="numpy"))
+
+
+class TestSumTwoFile(unittest.TestCase):
+    def write_values(self, values):
+        fd, path = tempfile.mkstemp(suffix=".bin")
+        with os.fdopen(fd, "wb") as f:
+            array("q", values).tofile(f)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_matches_sumtwo_for_chunk_sizes(self):
+        rnd = random.Random(4)
+        for _ in range(50):
+            a = [rnd.randint(-10, 10) for _ in range(rnd.randint(0, 30))]
+            b = rnd.randint(-20, 20)
+            path = self.write_values(a)
+            for chunk_size in (1, 3, 64):
+                self.assertEqual(sum_two_file(path, b, chunk_size), SumTwo(a, b))
+                self.assertEqual(sum_two_file(path, b, chunk_size, use_mmap=True), SumTwo(a, b))
+
+    def test_pair_across_blocks(self):
+        rnd = random.Random(5)
+        for _ in range(30):
+            a = rnd.sample(range(-1000, 1000), rnd.randint(2, 60))
+            b = a[-1] + rnd.choice(a[:-1])
+            path = self.write_values(a)
+            for chunk_size in (1, 4, 7):
+                self.assertEqual(sum_two_file(path, b, chunk_size), SumTwo(a, b))
+
+    def test_invalid_arguments(self):
+        path = self.write_values([2, 7, 11, 15])
+        self.assertIsNone(sum_two_file(path, 9.0))
+        self.assertIsNone(sum_two_file(path, 9, chunk_size=0))
+        with open(path, "ab") as f:
+            f.write(b"\x00")
+        self.assertIsNone(sum_two_file(path, 9))
+
+
+class TestOnlinePairSum(unittest.TestCase):
+    def test_examples(self):
+        s = OnlinePairSum([2, 7, 11, 15])
+        self.assertEqual(s.find(9), [0, 1])
+        self.assertEqual(s.remove_at(0), 2)
+        self.assertIsNone(s.find(9))
+        self.assertEqual(s.append(2), 3)
+        self.assertEqual(s.find(9), [0, 3])
+
+    def test_invalid_arguments(self):
+        self.assertIsNone(OnlinePairSum([2.0, 7]).find(9))
+        s = OnlinePairSum([2, 7])
+        self.assertIsNone(s.find(9.0))
+        self.assertIsNone(s.append(1.5))
+        self.assertIsNone(s.remove_at(2))
+        self.assertEqual(s.to_list(), [2, 7])
+
+    def test_storage_tracks_live_size(self):
+        """Поток append/remove_at не раздувает хранилище: мёртвые слоты уплотняются."""
+        s = OnlinePairSum(range(10))
+        mirror = list(range(10))
+        for step in range(10_000):
+            s.append(step)
+            mirror.append(step)
+            self.assertEqual(s.remove_at(0), mirror.pop(0))
+        self.assertEqual(s.to_list(), mirror)
+        self.assertLessEqual(len(s._values), 2 * len(s) + OnlinePairSum._COMPACT_MIN_SLOTS)
+        self.assertEqual(s.find(mirror[3] + mirror[7]), SumTwo(mirror, mirror[3] + mirror[7]))
+
+    def test_random_equivalence_with_sumtwo(self):
+        rnd = random.Random(5)
+        for _ in range(20):
+            a = [rnd.randint(-8, 8) for _ in range(rnd.randint(0, 10))]
+            s = OnlinePairSum(a)
+            for _ in range(200):
+                op = rnd.randrange(3)
+                if op == 0:
+                    x = rnd.randint(-8, 8)
+                    self.assertEqual(s.append(x), len(a))
+                    a.append(x)
+                elif op == 1 and a:
+                    k = rnd.randrange(len(a))
+                    self.assertEqual(s.remove_at(k), a.pop(k))
+                else:
+                    b = rnd.randint(-16, 16)
+                    self.assertEqual(s.find(b), SumTwo(a, b))
+                self.assertEqual(len(s), len(a))
+            self.assertEqual(s.to_list(), a)
+
+
+class TestAllPairs(unittest.TestCase):
+    def brute(self, a, b):
+        return [(i, j) for i in range(len(a)) for j in range(i + 1, len(a)) if a[i] + a[j] == b]
+
+    def test_examples(self):
+        self.assertEqual(list(iter_pairs([1, 2, 3, 4], 5)), [(0, 3), (1, 2)])
+        self.assertEqual(list(iter_pairs([3, 3, 3], 6)), [(0, 1), (0, 2), (1, 2)])
+        self.assertEqual(count_pairs([3, 3, 3], 6), 3)
+        self.assertEqual(count_pairs([], 6), 0)
+
+    def test_is_lazy(self):
+        gen = iter_pairs([0] * 10000, 0)
+        self.assertEqual(next(gen), (0, 1))
+        self.assertEqual(next(gen), (0, 2))
+
+    def test_invalid_input(self):
+        self.assertIsNone(iter_pairs([1, 2.0], 3))
+        self.assertIsNone(count_pairs([1, 2], 3.0))
+
+    def test_matches_brute_random(self):
+        rnd = random.Random(8)
+        for _ in range(200):
+            a = [rnd.randint(-5, 5) for _ in range(rnd.randint(0, 15))]
+            b = rnd.randint(-10, 10)
+            expected = self.brute(a, b)
+            self.assertEqual(list(iter_pairs(a, b)), expected)
+            self.assertEqual(count_pairs(a, b), len(expected))
+            self.assertEqual(SumTwo(a, b), list(expected[0]) if expected else None)
+
+
+class TestKSum(unittest.TestCase):
+    def brute(self, a, b, k):
+        for combo in itertools.combinations(range(len(a)), k):
+            if sum(a[i] for i in combo) == b:
+                return combo
+        return None
+
+    def test_examples(self):
+        self.assertEqual(k_sum([1, 2, 3, 4, 5], 9, 3), (0, 2, 4))
+        self.assertEqual(k_sum([1, 0, -1, 0, -2, 2], 0, 4), (0, 1, 2, 3))
+        self.assertEqual(k_sum([2, 7, 11, 15], 9, 2), tuple(SumTwo([2, 7, 11, 15], 9)))
+        self.assertIsNone(k_sum([1, 2], 3, 3))
+
+    def test_invalid_input(self):
+        self.assertIsNone(k_sum([1, 2.0, 3], 6, 3))
+        self.assertIsNone(k_sum([1, 2, 3], 6.0, 3))
+        self.assertIsNone(k_sum([1, 2, 3], 6, 0))
+
+    def test_matches_brute_random(self):
+        rnd = random.Random(6)
+        for _ in range(200):
+            a = [rnd.randint(-6, 6) for _ in range(rnd.randint(0, 9))]
+            k = rnd.randint(1, 6)
+            b = rnd.randint(-10, 10)
+            self.assertEqual(k_sum(a, b, k), self.brute(a, b, k))
+
+
+class TestSumTwoParallel(unittest.TestCase):
+    def test_examples(self):
+        self.assertEqual(sum_two_parallel([2, 7, 11, 15], 9, workers=2), [0, 1])
+        self.assertEqual(sum_two_parallel([1, 2, 3, 4], 5, workers=2), [0, 3])
+        self.assertIsNone(sum_two_parallel([1, 2, 3], 7, workers=2))
+
+    def test_invalid_input(self):
+        self.assertIsNone(sum_two_parallel([2.0, 7], 9, workers=2))
+        self.assertIsNone(sum_two_parallel([2, 7], 9, workers=0))
+
+    def test_matches_sumtwo_random(self):
+        rnd = random.Random(7)
+        for _ in range(10):
+            a = array("q", (rnd.randint(-50, 50) for _ in range(rnd.randint(2, 200))))
+            b = rnd.randint(-100, 100)
+            self.assertEqual(sum_two_parallel(a, b, workers=3), SumTwo(a, b))
+
+
+class TestPairSumIndex(unittest.TestCase):
+    def test_examples(self):
+        self.assertEqual(PairSumIndex([2,7,11,15]).query(9), [0, 1])
+        self.assertEqual(PairSumIndex([3,3]).query(6), [0, 1])
+        self.assertIsNone(PairSumIndex([3]).query(6))
+
+    def test_invalid_input(self):
+        self.assertIsNone(PairSumIndex([2.0, 7]).query(9))
+        self.assertIsNone(PairSumIndex([2, 7]).query(9.0))
+
+    def test_query_many_matches_sumtwo(self):
+        rnd = random.Random(2)
+        for _ in range(50):
+            a = [rnd.randint(-10, 10) for _ in range(rnd.randint(0, 15))]
+            bs = list(range(-21, 22))
+            self.assertEqual(PairSumIndex(a).query_many(bs), [SumTwo(a, b) for b in bs])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
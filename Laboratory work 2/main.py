@@ -1,8 +1,215 @@
-from typing import Iterable, List, Literal, Optional, Tuple
+import argparse
+import math
+import random
+import statistics
+import time
+from numbers import Real
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Sequence, Tuple, Union
 
-GuessMethod = Literal["linear", "binary"]
+try:
+    import numpy as np
+except ImportError:  # guess_many работает поштучно
+    np = None
 
+GuessMethod = Literal["linear", "analytic", "binary", "interpolation", "exponential", "ternary"]
+Pool = Union[List[int], range]
+Strategy = Callable[[int, Sequence[int]], Optional[Tuple[int, int]]]
 
+
+def _range_contains(r: range, value: object) -> bool:
+    """Проверить принадлежность значения range-пулу за O(1).
+
+    Встроенный `in` для range быстр только для int: для float и прочих
+    чисел он перебирает весь диапазон, поэтому они приводятся к int.
+    """
+    if isinstance(value, int):
+        return value in r
+    if not isinstance(value, Real) or not math.isfinite(value):
+        return False
+    as_int = int(value)
+    return as_int == value and as_int in r
+
+
+def _range_ascending(r: range) -> range:
+    """Тот же range-пул, упорядоченный по возрастанию (без копирования)."""
+    return r if r.step > 0 else r[::-1]
+
+
+def _linear_search(target: int, start: int, finish: int) -> Optional[Tuple[int, int]]:
+    """Перебор инкрементом от start до finish со счётчиком попыток."""
+    attempts = 0
+    current = start
+
+    while current <= finish:
+        attempts += 1
+        if current == target:
+            return current, attempts
+        current += 1
+
+    return None
+
+
+def _linear_closed_form(target: int, start: int) -> Optional[Tuple[int, int]]:
+    """Результат _linear_search без цикла: число шагов от start до target — O(1)."""
+    offset = target - start
+    if offset < 0 or offset != int(offset):
+        return None
+    attempts = int(offset) + 1
+    return start + attempts - 1, attempts
+
+
+def _binary_search(
+    target: int,
+    arr: Sequence[int],
+    left: int = 0,
+    right: Optional[int] = None,
+    attempts: int = 0,
+) -> Optional[Tuple[int, int]]:
+    """Бинарный поиск по отсортированной последовательности со счётчиком попыток.
+
+    left/right ограничивают отрезок поиска, attempts — уже сделанные попытки.
+    """
+    if right is None:
+        right = len(arr) - 1
+
+    while left <= right:
+        mid = (left + right) // 2
+        attempts += 1
+        if arr[mid] == target:
+            return arr[mid], attempts
+        if arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+
+    return None
+
+
+# Реестр стратегий
+
+_STRATEGIES: Dict[str, Strategy] = {}
+
+
+def register_strategy(name: str) -> Callable[[Strategy], Strategy]:
+    """Зарегистрировать стратегию угадывания под именем метода.
+
+    Стратегия получает загаданное число (заведомо присутствующее в пуле)
+    и пул, отсортированный по возрастанию, и возвращает
+    (угаданное_число, число_попыток), считая одну попытку на каждое
+    сравнение с элементом пула.
+
+    Args:
+        name: Имя метода для guess_number и GuessPool.guess.
+
+    Returns:
+        Декоратор, возвращающий функцию без изменений.
+    """
+    def decorator(func: Strategy) -> Strategy:
+        _STRATEGIES[name] = func
+        return func
+
+    return decorator
+
+
+# Реализации стратегий, работающие прямо по исходному пулу (без GuessPool):
+# для разового угадывания они дешевле подготовки пула.
+_POOL_GUESSERS: Dict[Strategy, Callable[[int, Iterable[int]], Optional[Tuple[int, int]]]] = {}
+
+
+def _guesses_pool_for(strategy: Strategy) -> Callable:
+    """Отметить функцию как реализацию strategy по исходному (неподготовленному) пулу."""
+    def decorator(func: Callable) -> Callable:
+        _POOL_GUESSERS[strategy] = func
+        return func
+
+    return decorator
+
+
+def available_methods() -> List[str]:
+    """Имена зарегистрированных методов угадывания."""
+    return list(_STRATEGIES)
+
+
+@register_strategy("linear")
+def _strategy_linear(target: int, arr: Sequence[int]) -> Optional[Tuple[int, int]]:
+    return _linear_search(target, arr[0], arr[-1])
+
+
+@register_strategy("analytic")
+def _strategy_analytic(target: int, arr: Sequence[int]) -> Optional[Tuple[int, int]]:
+    return _linear_closed_form(target, arr[0])
+
+
+@register_strategy("binary")
+def _strategy_binary(target: int, arr: Sequence[int]) -> Optional[Tuple[int, int]]:
+    return _binary_search(target, arr)
+
+
+@register_strategy("interpolation")
+def _strategy_interpolation(target: int, arr: Sequence[int]) -> Optional[Tuple[int, int]]:
+    """Интерполяционный поиск: позиция пробы оценивается по значениям краёв.
+
+    На почти равномерных пулах требует O(log log n) попыток.
+    """
+    left, right = 0, len(arr) - 1
+    attempts = 0
+    while left <= right and arr[left] <= target <= arr[right]:
+        span = arr[right] - arr[left]
+        pos = left if span == 0 else left + int((target - arr[left]) * (right - left) // span)
+        attempts += 1
+        if arr[pos] == target:
+            return arr[pos], attempts
+        if arr[pos] < target:
+            left = pos + 1
+        else:
+            right = pos - 1
+    return None
+
+
+@register_strategy("exponential")
+def _strategy_exponential(target: int, arr: Sequence[int]) -> Optional[Tuple[int, int]]:
+    """Экспоненциальный поиск: удвоение границы, затем бинарный поиск в отрезке.
+
+    Попыток O(log k), где k — позиция числа в пуле.
+    """
+    attempts = 1
+    if arr[0] == target:
+        return arr[0], attempts
+    bound = 1
+    while bound < len(arr):
+        attempts += 1
+        if arr[bound] == target:
+            return arr[bound], attempts
+        if arr[bound] > target:
+            break
+        bound *= 2
+    return _binary_search(target, arr, bound // 2 + 1, min(bound, len(arr)) - 1, attempts)
+
+
+@register_strategy("ternary")
+def _strategy_ternary(target: int, arr: Sequence[int]) -> Optional[Tuple[int, int]]:
+    """Тернарный поиск: две пробы делят отрезок на три части."""
+    left, right = 0, len(arr) - 1
+    attempts = 0
+    while left <= right:
+        third = (right - left) // 3
+        m1, m2 = left + third, right - third
+        attempts += 1
+        if arr[m1] == target:
+            return arr[m1], attempts
+        attempts += 1
+        if arr[m2] == target:
+            return arr[m2], attempts
+        if target < arr[m1]:
+            right = m1 - 1
+        elif target > arr[m2]:
+            left = m2 + 1
+        else:
+            left, right = m1 + 1, m2 - 1
+    return None
+
+
+@_guesses_pool_for(_strategy_linear)
 def guess_linear(target: int, pool: Iterable[int]) -> Optional[Tuple[int, int]]:
     """Угадать число медленным перебором (инкрементом).
 
@@ -18,23 +225,47 @@ def guess_linear(target: int, pool: Iterable[int]) -> Optional[Tuple[int, int]]:
         (угаданное_число, число_попыток) или None, если target отсутствует
         в пуле либо число не удалось найти (что маловероятно при корректных данных).
     """
+    if isinstance(pool, range):
+        if not _range_contains(pool, target):
+            return None
+        arr = _range_ascending(pool)
+        return _linear_search(target, arr[0], arr[-1])
+
     s = set(pool)
     if target not in s:
         return None
 
-    attempts = 0
-    current = min(s)
-    finish = max(s)
+    return _linear_search(target, min(s), max(s))
 
-    while current <= finish:
-        attempts += 1
-        if current == target:
-            return current, attempts
-        current += 1
 
-    return None
+@_guesses_pool_for(_strategy_analytic)
+def guess_linear_analytic(target: int, pool: Iterable[int]) -> Optional[Tuple[int, int]]:
+    """Угадать число «медленным перебором», посчитав попытки по формуле.
 
+    Возвращает тот же результат, что guess_linear, но без пошагового цикла:
+    число попыток равно target - min(pool) + 1. Принадлежность проверяется
+    по исходному пулу, без построения множества; одноразовый итератор
+    (не Sequence) один раз копируется в список.
 
+    Args:
+        target: Загаданное число, которое нужно угадать.
+        pool: Коллекция допустимых значений (без повторов).
+
+    Returns:
+        (угаданное_число, число_попыток) или None, если target отсутствует в пуле.
+    """
+    if isinstance(pool, range):
+        if not _range_contains(pool, target):
+            return None
+        return _linear_closed_form(target, _range_ascending(pool)[0])
+    if not isinstance(pool, Sequence):
+        pool = list(pool)
+    if target not in pool:
+        return None
+    return _linear_closed_form(target, min(pool))
+
+
+@_guesses_pool_for(_strategy_binary)
 def guess_binary(target: int, pool: Iterable[int]) -> Optional[Tuple[int, int]]:
     """Угадать число бинарным поиском.
 
@@ -50,25 +281,16 @@ def guess_binary(target: int, pool: Iterable[int]) -> Optional[Tuple[int, int]]:
         (угаданное_число, число_попыток) или None, если target отсутствует
         в пуле либо не найден бинарным поиском.
     """
+    if isinstance(pool, range):
+        if not _range_contains(pool, target):
+            return None
+        return _binary_search(target, _range_ascending(pool))
+
     s = set(pool)
     if target not in s:
         return None
 
-    arr = sorted(s)
-    left, right = 0, len(arr) - 1
-    attempts = 0
-
-    while left <= right:
-        mid = (left + right) // 2
-        attempts += 1
-        if arr[mid] == target:
-            return arr[mid], attempts
-        if arr[mid] < target:
-            left = mid + 1
-        else:
-            right = mid - 1
-
-    return None
+    return _binary_search(target, sorted(s))
 
 
 def guess_number(
@@ -88,41 +310,268 @@ def guess_number(
     Args:
         target: Загаданное число.
         pool: Список/итерируемый объект допустимых значений.
-        method: "linear" (медленный перебор) или "binary" (бинарный поиск).
+        method: "linear" (медленный перебор), "analytic" (тот же перебор,
+            посчитанный по формуле), "binary" (бинарный поиск) или другой
+            метод из реестра (см. register_strategy): "interpolation",
+            "exponential", "ternary".
 
     Returns:
         (угаданное_число, число_попыток) или None, если метод некорректен
         либо число отсутствует в пуле/не найдено.
     """
-    if method == "linear":
-        return guess_linear(target, pool)
+    strategy = _STRATEGIES.get(method)
+    if strategy is None:
+        return None
+    guess_pool = _POOL_GUESSERS.get(strategy)
+    if guess_pool is not None:
+        return guess_pool(target, pool)
+    return GuessPool(pool).guess(target, method)
+
+
+class GuessPool:
+    """Пул значений, подготовленный один раз для многократного угадывания.
+
+    Множество для проверки принадлежности и отсортированная копия строятся
+    в конструкторе (O(n log n)), после чего каждое угадывание не копирует
+    и не сортирует пул заново: бинарный поиск стоит O(log n).
+    Ленивый range-пул (build_pool(..., lazy=True)) не копируется вовсе.
+
+    Attributes:
+        members: Множество значений пула (или сам range).
+        sorted_values: Значения пула по возрастанию.
+    """
+
+    def __init__(self, pool: Iterable[int]) -> None:
+        if isinstance(pool, range):
+            self.members = pool
+            self.sorted_values: Sequence[int] = _range_ascending(pool)
+        else:
+            self.members = frozenset(pool)
+            self.sorted_values = sorted(self.members)
+
+    def __len__(self) -> int:
+        return len(self.sorted_values)
+
+    def __contains__(self, value: object) -> bool:
+        if isinstance(self.members, range):
+            return _range_contains(self.members, value)
+        return value in self.members
+
+    def guess(self, target: int, method: GuessMethod = "linear") -> Optional[Tuple[int, int]]:
+        """Угадать число в пуле; результат тот же, что у guess_number.
+
+        Args:
+            target: Загаданное число.
+            method: Имя зарегистрированного метода ("linear", "analytic" — O(1),
+                "binary", "interpolation", "exponential", "ternary", ...).
+
+        Returns:
+            (угаданное_число, число_попыток) или None, если метод некорректен
+            либо число отсутствует в пуле.
+        """
+        strategy = _STRATEGIES.get(method)
+        if strategy is None or target not in self:
+            return None
+        return strategy(target, self.sorted_values)
+
+
+# Пакетное угадывание
+
+def _summary(attempts: Sequence[int]) -> Dict[str, Optional[float]]:
+    """Среднее, медиана, 99-й перцентиль (по рангу) и максимум числа попыток."""
+    if len(attempts) == 0:
+        return {"mean": None, "p50": None, "p99": None, "max": None}
+    ordered = np.sort(attempts) if np is not None and isinstance(attempts, np.ndarray) else sorted(attempts)
+
+    def rank(q: float) -> int:
+        return int(ordered[max(math.ceil(q * len(ordered)) - 1, 0)])
+
+    return {
+        "mean": float(sum(ordered) / len(ordered)) if isinstance(ordered, list) else float(ordered.mean()),
+        "p50": rank(0.50),
+        "p99": rank(0.99),
+        "max": int(ordered[-1]),
+    }
+
+
+def _guess_many_scalar(targets: Sequence[Any], gp: "GuessPool", method: str) -> Dict[str, Any]:
+    """guess_many поштучно через GuessPool.guess (для любых методов и входов)."""
+    if np is not None and isinstance(targets, np.ndarray):
+        # числа NumPy сравнивались бы с int пула через float64
+        targets = targets.tolist()
+    values: List[Optional[int]] = []
+    attempts: List[int] = []
+    for t in targets:
+        res = gp.guess(t, method)
+        values.append(None if res is None else res[0])
+        attempts.append(0 if res is None else res[1])
+    found = [v is not None for v in values]
+    stats = _summary([a for a, f in zip(attempts, found) if f])
+    if np is not None:
+        return {"values": np.array(values, dtype=object), "attempts": np.array(attempts),
+                "found": np.array(found), **stats}
+    return {"values": values, "attempts": attempts, "found": found, **stats}
+
+
+def _guess_many_numpy(t: "np.ndarray", arr: Sequence[int], method: str) -> Dict[str, Any]:
+    """Векторизованный guess_many для "binary", "linear" и "analytic".
+
+    Для range-пула элементы вычисляются как start + i*step, без материализации.
+    Бинарный поиск моделируется по уровням: на каждом шаге все ещё не
+    угаданные числа одновременно сравниваются со своими серединами
+    (те же mid, что у guess_binary), так что число попыток совпадает;
+    уровней — не больше ceil(log2(n + 1)).
+    """
+    n = len(arr)
+    if isinstance(arr, range):
+        start, step = arr.start, arr.step
+        dtype = np.dtype(np.int64)
+
+        def value_at(i: "np.ndarray") -> "np.ndarray":
+            return start + i * step
+
+        if n:
+            found = (t >= arr[0]) & (t <= arr[-1]) & (np.mod(t - start, step) == 0)
+        else:
+            found = np.zeros(len(t), dtype=bool)
+    else:
+        values = np.asarray(arr)
+        dtype = values.dtype
+
+        def value_at(i: "np.ndarray") -> "np.ndarray":
+            return values[i]
+
+        if n:
+            pos = np.minimum(np.searchsorted(values, t), n - 1)
+            found = values[pos] == t
+        else:
+            found = np.zeros(len(t), dtype=bool)
+
+    attempts = np.zeros(len(t), dtype=np.int64)
+    result = np.zeros(len(t), dtype=dtype)
     if method == "binary":
-        return guess_binary(target, pool)
-    return None
+        lo = np.zeros(len(t), dtype=np.int64)
+        hi = np.full(len(t), n - 1, dtype=np.int64)
+        active = found.copy()
+        while active.any():
+            mid = (lo + hi) // 2
+            probe = value_at(np.where(active, mid, 0))
+            attempts += active
+            hit = active & (probe == t)
+            less = active & (probe < t)
+            greater = active & ~less & ~hit
+            lo = np.where(less, mid + 1, lo)
+            hi = np.where(greater, mid - 1, hi)
+            result = np.where(hit, probe, result)
+            active &= ~hit
+    else:
+        first = value_at(np.zeros(1, dtype=np.int64))[0] if n else 0
+        offset = t - first
+        found &= offset == np.floor(offset)
+        attempts[found] = (offset[found] + 1).astype(np.int64)
+        result[found] = first + attempts[found] - 1
+    return {"values": result, "attempts": attempts, "found": found,
+            **_summary(attempts[found])}
+
+
+def _exact_targets(t: "np.ndarray", pool_kind: str, pool_bound: Any) -> Optional["np.ndarray"]:
+    """Привести загаданные числа к типу, точно сравнимому с пулом, или вернуть None.
+
+    NumPy сравнивает int64 с uint64 и с float64 через float64, теряя точность
+    выше 2**53; в таких случаях guess_many уходит в поштучный режим.
+    pool_bound — наибольший модуль значения пула.
+    """
+    if t.dtype.kind == "u":
+        if t.size and int(t.max()) > np.iinfo(np.int64).max:
+            return None
+        t = t.astype(np.int64)
+    if t.dtype.kind == pool_kind:
+        return t
+    if t.dtype.kind == "f":
+        return t if pool_bound <= 2 ** 53 else None
+    if t.size and max(abs(int(t.min())), abs(int(t.max()))) > 2 ** 53:
+        return None
+    return t
+
+
+def guess_many(targets: Iterable[Any], pool: Iterable[int], method: GuessMethod = "binary") -> Dict[str, Any]:
+    """Угадать сразу много чисел в одном пуле.
 
+    Пул готовится один раз (GuessPool). Для методов "binary", "linear"
+    и "analytic" при наличии NumPy все числа обрабатываются одним
+    векторизованным проходом; результаты в точности совпадают с
+    поштучными guess_binary / guess_linear. Прочие методы, нечисловые
+    входы и среда без NumPy обрабатываются поштучно.
 
-def build_pool(start: int, end: int) -> List[int]:
+    Args:
+        targets: Загаданные числа.
+        pool: Список/итерируемый объект допустимых значений.
+        method: Метод угадывания (см. guess_number).
+
+    Returns:
+        dict с ключами:
+            - 'values' — угаданные числа (для не найденных — 0 в векторном
+              режиме, None в поштучном);
+            - 'attempts' — число попыток (0 для не найденных);
+            - 'found' — признак, что число угадано;
+            - 'mean', 'p50', 'p99', 'max' — статистика попыток по угаданным
+              (None, если не угадано ни одно).
+    """
+    gp = GuessPool(pool)
+    if np is None or not isinstance(targets, np.ndarray):
+        targets = list(targets)
+    if np is None or method not in ("binary", "linear", "analytic"):
+        return _guess_many_scalar(targets, gp, method)
+    t = np.asarray(targets)
+    if t.ndim != 1 or t.dtype.kind not in "iuf":
+        return _guess_many_scalar(targets, gp, method)
+    arr = gp.sorted_values
+    if isinstance(arr, range):
+        if arr and max(abs(arr[0]), abs(arr[-1])) >= 2 ** 62:
+            return _guess_many_scalar(targets, gp, method)
+        kind = "i"
+    else:
+        try:
+            arr = np.asarray(arr)
+        except OverflowError:
+            return _guess_many_scalar(targets, gp, method)
+        kind = arr.dtype.kind
+        # разность значений (t - first в линейном методе) должна влезать в int64
+        if kind not in "if" or (arr.size and arr[-1] - float(arr[0]) >= 2 ** 62):
+            return _guess_many_scalar(targets, gp, method)
+    t = _exact_targets(t, kind, max(abs(arr[0]), abs(arr[-1])) if len(arr) else 0)
+    if t is None:
+        return _guess_many_scalar(targets, gp, method)
+    return _guess_many_numpy(t, arr, method)
+
+
+def build_pool(start: int, end: int, lazy: bool = False) -> Pool:
     """Сформировать пул значений как список целых в диапазоне [start, end].
 
     Args:
         start: Начало диапазона (включительно).
         end: Конец диапазона (включительно). Может быть меньше start — порядок нормализуется.
+        lazy: Вернуть ленивый range вместо списка: память не зависит от ширины
+            диапазона, а guess_* проверяют принадлежность, берут границы
+            и индексируют его за O(1).
 
     Returns:
-        Список int: [min(start,end), ..., max(start,end)].
+        Список int: [min(start,end), ..., max(start,end)] либо range с теми же значениями.
     """
     lo, hi = sorted((start, end))
+    if lazy:
+        return range(lo, hi + 1)
     return list(range(lo, hi + 1))
 
 
-def read_from_keyboard() -> Tuple[int, List[int], GuessMethod]:
+def read_from_keyboard() -> Tuple[int, Pool, GuessMethod]:
     """Вспомогательная функция для ввода параметров с клавиатуры.
 
     Последовательно запрашивает:
       - начало диапазона,
       - конец диапазона,
       - загаданное число,
-      - метод угадывания ("linear" или "binary").
+      - метод угадывания (любой из available_methods()).
 
     Выполняет базовую валидацию и возвращает готовые параметры для guess_number().
 
@@ -133,19 +582,18 @@ def read_from_keyboard() -> Tuple[int, List[int], GuessMethod]:
         try:
             start = int(input("Введите начало диапазона (целое число): ").strip())
             end = int(input("Введите конец диапазона (целое число): ").strip())
-            pool = build_pool(start, end)
+            pool = build_pool(start, end, lazy=True)
 
             target = int(input("Введите загаданное число: ").strip())
             if target not in pool:
-                lo, hi = min(pool), max(pool)
+                lo, hi = pool[0], pool[-1]
                 print(f"Число вне диапазона [{lo}; {hi}]. Попробуйте снова.\n")
                 continue
 
-            method_str = input(
-                'Выберите метод ("linear" или "binary"): '
-            ).strip().lower()
-            if method_str not in ("linear", "binary"):
-                print('Метод должен быть "linear" или "binary". Попробуйте снова.\n')
+            names = ", ".join(f'"{m}"' for m in available_methods())
+            method_str = input(f"Выберите метод ({names}): ").strip().lower()
+            if method_str not in _STRATEGIES:
+                print(f"Метод должен быть одним из: {names}. Попробуйте снова.\n")
                 continue
 
             return target, pool, method_str
@@ -153,7 +601,76 @@ def read_from_keyboard() -> Tuple[int, List[int], GuessMethod]:
             print("Ожидалось целое число. Попробуйте снова.\n")
 
 
-if __name__ == "__main__":
+def sample_pools(size: int = 100_000, seed: int = 0) -> Dict[str, Pool]:
+    """Пулы разных распределений для сравнения стратегий.
+
+    - "uniform": непрерывный диапазон (ленивый range);
+    - "sparse": случайная равномерная выборка из широкого диапазона;
+    - "skewed": квадраты чисел — плотность падает к концу пула.
+    """
+    rnd = random.Random(seed)
+    return {
+        "uniform": build_pool(1, size, lazy=True),
+        "sparse": rnd.sample(range(size * 100), size),
+        "skewed": [i * i for i in range(size)],
+    }
+
+
+def benchmark_strategies(
+    pools: Optional[Dict[str, Pool]] = None,
+    methods: Optional[Iterable[str]] = None,
+    samples: int = 2000,
+    seed: int = 0,
+) -> List[Dict[str, object]]:
+    """Сравнить стратегии по числу попыток и времени на разных пулах.
+
+    Для каждого пула пул готовится один раз (GuessPool), затем по каждой
+    стратегии угадываются одни и те же `samples` случайных чисел из пула.
+
+    Args:
+        pools: Имя распределения -> пул (по умолчанию sample_pools()).
+        methods: Стратегии (по умолчанию все, кроме пошагового "linear").
+        samples: Число загаданных чисел на пул.
+        seed: Зерно генератора загаданных чисел.
+
+    Returns:
+        Список строк таблицы: pool, method, mean_attempts, max_attempts, total_ms.
+    """
+    pools = sample_pools() if pools is None else pools
+    methods = [m for m in available_methods() if m != "linear"] if methods is None else list(methods)
+    rnd = random.Random(seed)
+    rows: List[Dict[str, object]] = []
+    for pool_name, pool in pools.items():
+        gp = GuessPool(pool)
+        targets = [gp.sorted_values[rnd.randrange(len(gp))] for _ in range(samples)]
+        for method in methods:
+            started = time.perf_counter()
+            attempts = [gp.guess(t, method)[1] for t in targets]
+            elapsed = time.perf_counter() - started
+            rows.append({
+                "pool": pool_name,
+                "method": method,
+                "mean_attempts": statistics.mean(attempts),
+                "max_attempts": max(attempts),
+                "total_ms": 1000.0 * elapsed,
+            })
+    return rows
+
+
+def main() -> None:
+    """Интерактивная игра либо сравнение стратегий (--bench)."""
+    parser = argparse.ArgumentParser(description="Угадай число")
+    parser.add_argument("--bench", action="store_true", help="сравнить стратегии угадывания")
+    args = parser.parse_args()
+
+    if args.bench:
+        print(f"{'пул':>8} | {'метод':>13} | {'среднее':>14} | {'худшее':>11} | {'время, мс':>9}")
+        print("-" * 68)
+        for row in benchmark_strategies():
+            print(f"{row['pool']:>8} | {row['method']:>13} | {row['mean_attempts']:14.2f} | "
+                  f"{row['max_attempts']:11d} | {row['total_ms']:9.2f}")
+        return
+
     tgt, numbers, how = read_from_keyboard()
     result = guess_number(tgt, numbers, how)
     print(result)
@@ -163,3 +680,7 @@ if __name__ == "__main__":
         value, attempts = result
         print(f"\nУгадано число: {value}")
         print(f"Количество попыток: {attempts}")
+
+
+if __name__ == "__main__":
+    main()
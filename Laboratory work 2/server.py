@@ -0,0 +1,191 @@
+import argparse
+import asyncio
+import math
+import random
+import time
+from typing import Dict, List, Optional
+
+from main import GuessPool, available_methods, build_pool
+
+DEFAULT_METHOD = "binary"
+
+# Методы с пошаговым циклом по пулу заменяются равносильной формулой O(1):
+# иначе один запрос на большом пуле блокирует цикл событий для всех сессий.
+SERVER_METHOD_ALIASES = {"linear": "analytic"}
+
+
+def handle_line(line: str, session: Dict[str, Optional[GuessPool]]) -> str:
+    """Обработать одну команду строчного протокола и вернуть ответ.
+
+    Команды:
+      - ``POOL <start> <end>`` — задать пул сессии [start, end]; ответ ``OK <размер>``;
+      - ``GUESS <число> [метод]`` — угадать число в пуле сессии;
+        ответ ``OK <число> <попытки>`` или ``NONE``. Метод "linear"
+        считается формулой "analytic" (тот же ответ, без цикла по пулу).
+
+    Пул сессии ленивый (range) и готовится один раз (GuessPool), поэтому
+    каждое угадывание не копирует и не сортирует его заново.
+
+    Args:
+        line: Строка команды без перевода строки.
+        session: Состояние сессии (ключ "pool").
+
+    Returns:
+        Строка ответа; ``ERR <описание>`` при некорректной команде.
+    """
+    parts = line.split()
+    if not parts:
+        return "ERR пустая команда"
+    command = parts[0].upper()
+    try:
+        if command == "POOL" and len(parts) == 3:
+            pool = GuessPool(build_pool(int(parts[1]), int(parts[2]), lazy=True))
+            session["pool"] = pool
+            return f"OK {len(pool)}"
+        if command == "GUESS" and len(parts) in (2, 3):
+            pool = session.get("pool")
+            if pool is None:
+                return "ERR сначала задайте пул командой POOL"
+            method = parts[2].lower() if len(parts) == 3 else DEFAULT_METHOD
+            if method not in available_methods():
+                return "ERR неизвестный метод"
+            method = SERVER_METHOD_ALIASES.get(method, method)
+            result = pool.guess(int(parts[1]), method)
+            return "NONE" if result is None else f"OK {result[0]} {result[1]}"
+    except ValueError:
+        return "ERR ожидалось целое число"
+    return "ERR неизвестная команда"
+
+
+async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Обслужить одно соединение (одну сессию) до QUIT или закрытия."""
+    session: Dict[str, Optional[GuessPool]] = {"pool": None}
+    try:
+        while True:
+            raw = await reader.readline()
+            if not raw:
+                break
+            line = raw.decode("utf-8", errors="replace").strip()
+            if line.upper() == "QUIT":
+                break
+            writer.write((handle_line(line, session) + "\n").encode("utf-8"))
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+    """Запустить asyncio-сервер игры «угадай число» (port=0 — свободный порт)."""
+    return await asyncio.start_server(handle_client, host, port, backlog=4096)
+
+
+async def _run_session(
+    host: str,
+    port: int,
+    guesses: int,
+    span: int,
+    rnd: random.Random,
+    latencies: List[float],
+) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        requests = [f"POOL 1 {span}"]
+        requests += [f"GUESS {rnd.randint(1, span)} {DEFAULT_METHOD}" for _ in range(guesses)]
+        for request in requests:
+            started = time.perf_counter()
+            writer.write((request + "\n").encode("utf-8"))
+            await writer.drain()
+            reply = await reader.readline()
+            latencies.append(time.perf_counter() - started)
+            if not reply.startswith(b"OK"):
+                raise RuntimeError(f"неожиданный ответ на {request!r}: {reply!r}")
+        writer.write(b"QUIT\n")
+        await writer.drain()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_load(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    sessions: int = 1000,
+    guesses: int = 20,
+    concurrency: int = 200,
+    span: int = 1_000_000,
+    seed: int = 0,
+) -> Dict[str, float]:
+    """Нагрузочный клиент: много сессий, в каждой POOL и серия GUESS.
+
+    Args:
+        host, port: Адрес сервера.
+        sessions: Всего сессий (соединений).
+        guesses: Угадываний в одной сессии.
+        concurrency: Сколько сессий открыто одновременно.
+        span: Ширина пула каждой сессии.
+        seed: Зерно генератора загаданных чисел.
+
+    Returns:
+        dict: 'sessions_per_sec', 'requests' и задержки ответа
+        'p50_ms', 'p99_ms', 'max_ms'.
+    """
+    rnd = random.Random(seed)
+    latencies: List[float] = []
+    gate = asyncio.Semaphore(concurrency)
+
+    async def limited() -> None:
+        async with gate:
+            await _run_session(host, port, guesses, span, rnd, latencies)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(limited() for _ in range(sessions)))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+
+    def rank_ms(q: float) -> float:
+        return 1000.0 * ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+    return {
+        "sessions_per_sec": sessions / elapsed,
+        "requests": len(ordered),
+        "p50_ms": rank_ms(0.50),
+        "p99_ms": rank_ms(0.99),
+        "max_ms": 1000.0 * ordered[-1],
+    }
+
+
+async def _serve_forever(host: str, port: int) -> None:
+    server = await start_server(host, port)
+    addr = server.sockets[0].getsockname()
+    print(f"Сервер слушает {addr[0]}:{addr[1]}")
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    """CLI: ``serve`` — запустить сервер, ``load`` — нагрузочный клиент."""
+    parser = argparse.ArgumentParser(description="Сервер игры «угадай число»")
+    parser.add_argument("mode", choices=("serve", "load"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--guesses", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.mode == "serve":
+        asyncio.run(_serve_forever(args.host, args.port))
+        return
+    report = asyncio.run(run_load(args.host, args.port, args.sessions,
+                                  args.guesses, args.concurrency))
+    print(f"Сессий в секунду: {report['sessions_per_sec']:.1f}")
+    print(f"Запросов: {report['requests']}")
+    print(f"Задержка ответа, мс: p50 = {report['p50_ms']:.3f}, "
+          f"p99 = {report['p99_ms']:.3f}, max = {report['max_ms']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,22 @@
+import asyncio
+import time
 import unittest
 from typing import List
 
 
 from main import (
+    GuessPool,
+    _STRATEGIES,
     guess_number,
     guess_linear,
+    guess_linear_analytic,
     guess_binary,
     build_pool,
+    guess_many,
+    np,
+    register_strategy,
 )
+from server import handle_line, run_load, start_server
 
 
 class TestGuessNumber(unittest.TestCase):
@@ -105,5 +114,195 @@ class TestGuessNumber(unittest.TestCase):
         self.assertIsNone(res)
 
 
+class TestLazyRangePool(unittest.TestCase):
+    def test_build_pool_lazy(self):
+        self.assertEqual(build_pool(20, 10, lazy=True), range(10, 21))
+        self.assertEqual(list(build_pool(20, 10, lazy=True)), build_pool(20, 10))
+
+    def test_matches_list_pool(self):
+        pools = [range(-5, 41), range(40, -6, -1), range(0, 30, 3), range(0)]
+        for pool in pools:
+            as_list = list(pool)
+            gp = GuessPool(pool)
+            for target in list(range(-7, 43)) + [5.0, 6.5, float("nan"), "6"]:
+                for method in ("linear", "analytic", "binary"):
+                    expected = guess_number(target, as_list, method)
+                    self.assertEqual(guess_number(target, pool, method), expected)
+                    self.assertEqual(gp.guess(target, method), expected)
+
+    def test_huge_range_is_not_materialized(self):
+        pool = build_pool(1, 10 ** 18, lazy=True)
+        self.assertEqual(guess_binary(10 ** 18, pool), (10 ** 18, 60))
+        self.assertEqual(guess_linear_analytic(10 ** 18, pool), (10 ** 18, 10 ** 18))
+        self.assertIn(10 ** 17, GuessPool(pool))
+
+
+class TestGuessLinearAnalytic(unittest.TestCase):
+    def test_matches_stepping_loop(self):
+        pools = [build_pool(-5, 40), [10, 4, 7, 1, 3, 8], [5], [], [0.5, 1.5, 3.0]]
+        for pool in pools:
+            for target in list(range(-7, 43)) + [5.0, 1.5, 2.5, "6"]:
+                self.assertEqual(guess_linear_analytic(target, pool), guess_linear(target, pool))
+                self.assertEqual(guess_number(target, pool, "analytic"), guess_linear(target, pool))
+
+    def test_one_shot_iterator(self):
+        """Итератор читается один раз: результат как у линейного перебора."""
+        for target in (1, 3, 4):
+            self.assertEqual(guess_number(target, iter([1, 2, 3]), "analytic"),
+                             guess_number(target, iter([1, 2, 3]), "linear"))
+        self.assertEqual(guess_linear_analytic(3, (x for x in [3, 1, 2])), (3, 3))
+
+    def test_huge_span(self):
+        pool = [0, 10 ** 12]
+        self.assertEqual(guess_linear_analytic(10 ** 12, pool), (10 ** 12, 10 ** 12 + 1))
+
+
+class TestStrategyRegistry(unittest.TestCase):
+    def test_new_strategies_find_every_member(self):
+        pools = [build_pool(-5, 40), [10, 4, 7, 1, 3, 8], [5], [i * i for i in range(60)]]
+        for pool in pools:
+            gp = GuessPool(pool)
+            for method in ("interpolation", "exponential", "ternary"):
+                for target in pool:
+                    self.assertFound(guess_number(target, pool, method), target)
+                    self.assertEqual(gp.guess(target, method), guess_number(target, pool, method))
+                self.assertIsNone(guess_number(-100, pool, method))
+                self.assertIsNone(guess_number(2.5, pool, method))
+
+    def assertFound(self, res, target):
+        self.assertIsNotNone(res)
+        self.assertEqual(res[0], target)
+        self.assertGreater(res[1], 0)
+
+    def test_interpolation_on_uniform_pool(self):
+        pool = build_pool(1, 10 ** 6, lazy=True)
+        self.assertEqual(guess_number(777_777, pool, "interpolation"), (777_777, 1))
+
+    def test_register_custom_strategy(self):
+        @register_strategy("first-probe")
+        def first_probe(target, arr):
+            return target, 1
+
+        self.addCleanup(_STRATEGIES.pop, "first-probe", None)
+        self.assertEqual(guess_number(3, [1, 2, 3], "first-probe"), (3, 1))
+        self.assertIsNone(guess_number(4, [1, 2, 3], "first-probe"))
+
+    def test_overridden_builtin_goes_through_registry(self):
+        original = _STRATEGIES["binary"]
+        self.addCleanup(register_strategy("binary"), original)
+        register_strategy("binary")(lambda target, arr: (target, 42))
+        self.assertEqual(guess_number(3, [1, 2, 3], "binary"), (3, 42))
+
+
+class TestGuessMany(unittest.TestCase):
+    POOLS = [build_pool(-5, 40), build_pool(-5, 40, lazy=True), range(0, 60, 3),
+             [10, 4, 7, 1, 3, 8], [5], [], range(0)]
+
+    def check_consistent(self, targets, pool, method):
+        res = guess_many(targets, pool, method)
+        found_attempts = []
+        for k, t in enumerate(targets):
+            expected = guess_number(t, pool, method)
+            if expected is None:
+                self.assertFalse(res["found"][k])
+                self.assertEqual(res["attempts"][k], 0)
+            else:
+                self.assertTrue(res["found"][k])
+                self.assertEqual((res["values"][k], res["attempts"][k]), expected)
+                found_attempts.append(expected[1])
+        if found_attempts:
+            self.assertEqual(res["max"], max(found_attempts))
+            self.assertAlmostEqual(res["mean"], sum(found_attempts) / len(found_attempts))
+        else:
+            self.assertIsNone(res["mean"])
+
+    def test_matches_scalar(self):
+        targets = list(range(-7, 62)) + [5.0, 6.5]
+        for pool in self.POOLS:
+            for method in ("binary", "linear", "analytic", "interpolation"):
+                self.check_consistent(targets, pool, method)
+
+    @unittest.skipUnless(np is not None, "numpy не установлен")
+    def test_numpy_targets(self):
+        pool = build_pool(1, 100_000, lazy=True)
+        res = guess_many(np.arange(1, 100_001), pool, "binary")
+        self.assertTrue(res["found"].all())
+        self.assertEqual(res["max"], 17)
+        for t in range(1, 100_001, 997):
+            self.assertEqual(res["attempts"][t - 1], guess_binary(t, pool)[1])
+        self.assertEqual(res["p50"], 16)
+
+    @unittest.skipUnless(np is not None, "numpy не установлен")
+    def test_wide_list_pool_falls_back_to_exact(self):
+        pool = [-(2 ** 63) + 1, 2 ** 63 - 1]
+        res = guess_many([2 ** 63 - 1], pool, "analytic")
+        self.assertTrue(res["found"][0])
+        self.assertEqual(res["attempts"][0], guess_linear_analytic(2 ** 63 - 1, pool)[1])
+        self.assertEqual(res["attempts"][0], 2 ** 64 - 1)
+
+    @unittest.skipUnless(np is not None, "numpy не установлен")
+    def test_targets_compared_without_precision_loss(self):
+        pool = list(range(2 ** 62, 2 ** 62 + 10))
+        for targets in (np.array([2 ** 62 + 3], dtype=np.uint64), np.array([2.0 ** 62 + 3])):
+            for method in ("binary", "analytic"):
+                res = guess_many(targets, pool, method)
+                expected = guess_number(targets.tolist()[0], pool, method)
+                self.assertEqual(bool(res["found"][0]), expected is not None)
+                if expected is not None:
+                    self.assertEqual(res["attempts"][0], expected[1])
+        res = guess_many(np.array([2 ** 62 + 3], dtype=np.uint64), pool, "binary")
+        self.assertEqual(res["attempts"][0], guess_binary(2 ** 62 + 3, pool)[1])
+        res = guess_many([2 ** 53 + 1], [float(2 ** 53)], "binary")
+        self.assertFalse(res["found"][0])
+
+
+class TestGuessPool(unittest.TestCase):
+    def test_matches_guess_number(self):
+        pools = [build_pool(-5, 40), [10, 4, 7, 1, 3, 8], [5], []]
+        for pool in pools:
+            gp = GuessPool(pool)
+            for target in list(range(-7, 43)) + [5.0, "6"]:
+                for method in ("linear", "analytic", "binary", "something"):
+                    self.assertEqual(gp.guess(target, method), guess_number(target, pool, method))
+
+    def test_pool_prepared_once(self):
+        gp = GuessPool([3, 1, 2, 3])
+        self.assertEqual(gp.sorted_values, [1, 2, 3])
+        self.assertEqual(len(gp), 3)
+        self.assertIn(2, gp)
+
+
+class TestGuessServer(unittest.TestCase):
+    def test_handle_line(self):
+        session = {"pool": None}
+        self.assertTrue(handle_line("GUESS 5", session).startswith("ERR"))
+        self.assertEqual(handle_line("POOL 20 10", session), "OK 11")
+        self.assertEqual(handle_line("GUESS 12 linear", session), "OK 12 3")
+        self.assertEqual(handle_line("GUESS 15", session), f"OK 15 {guess_binary(15, build_pool(10, 20))[1]}")
+        self.assertEqual(handle_line("GUESS 25", session), "NONE")
+        self.assertTrue(handle_line("GUESS abc", session).startswith("ERR"))
+        self.assertTrue(handle_line("JUMP", session).startswith("ERR"))
+        self.assertTrue(handle_line("GUESS 12 zigzag", session).startswith("ERR"))
+
+    def test_linear_does_not_step_through_huge_pool(self):
+        """linear отвечает формулой: пул в 10^9 не блокирует цикл событий."""
+        session = {"pool": None}
+        handle_line("POOL 1 1000000000", session)
+        started = time.perf_counter()
+        self.assertEqual(handle_line("GUESS 999999999 linear", session), "OK 999999999 999999999")
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+    def test_concurrent_sessions(self):
+        async def scenario():
+            server = await start_server(port=0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await run_load(port=port, sessions=50, guesses=5, concurrency=20)
+
+        report = asyncio.run(scenario())
+        self.assertEqual(report["requests"], 50 * 6)
+        self.assertGreater(report["sessions_per_sec"], 0)
+
+
 if __name__ == "__main__":
     unittest.main()
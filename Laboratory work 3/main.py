@@ -1,5 +1,13 @@
+import mmap
+import statistics
+import struct
+import sys
+import timeit
+import tracemalloc
+from array import array
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, List, Literal, Optional, Protocol, Tuple, Union
 
 
 # Контейнеры
@@ -18,8 +26,50 @@ class Node:
     right: Optional["Node"]
 
 
+@dataclass(frozen=True, slots=True)
+class SlotNode:
+    """Узел бинарного дерева без __dict__ (slots): компактнее Node.
+
+    Attributes:
+        value: Значение в узле.
+        left: Левый потомок (SlotNode) или None.
+        right: Правый потомок (SlotNode) или None.
+    """
+    value: int
+    left: Optional["SlotNode"]
+    right: Optional["SlotNode"]
+
+
 DictTree = Dict[str, Any]
-TreeLike = Union[DictTree, Node]
+TupleTree = Tuple[int, Optional["TupleTree"], Optional["TupleTree"]]
+TreeLike = Union[DictTree, Node, SlotNode, TupleTree]
+
+
+class NodeBuilder(Protocol):
+    """Построитель узла: одна аллокация на узел из значения и готовых потомков."""
+
+    def __call__(self, value: int, left: Optional[Any], right: Optional[Any]) -> Any:
+        ...
+
+
+def _build_dict(value: int, left: Optional[DictTree], right: Optional[DictTree]) -> DictTree:
+    return {"value": value, "left": left, "right": right}
+
+
+def _build_tuple(value: int, left: Optional[TupleTree], right: Optional[TupleTree]) -> TupleTree:
+    return (value, left, right)
+
+
+# container -> построитель узла
+CONTAINERS: Dict[str, NodeBuilder] = {
+    "dict": _build_dict,
+    "dataclass": Node,
+    "tuple": _build_tuple,
+    "slots": SlotNode,
+}
+
+# Контейнеры, узлы которых можно разделять между поддеревьями (share=True)
+IMMUTABLE_CONTAINERS = frozenset({"dataclass", "tuple", "slots"})
 
 
 # Правила варианта 4
@@ -33,29 +83,201 @@ def _children_variant4(value: int) -> tuple[int, int]:
     return value * 4, value + 1
 
 
+# Неявное (виртуальное) дерево
+
+class VirtualTree:
+    """Неявный узел дерева варианта 4: значение вычисляется по корню и пути.
+
+    Повторяет навигацию Node (.value, .left, .right), но потомки создаются
+    лишь при обращении и нигде не хранятся. Узел держит глубину и путь
+    в виде целых чисел (путь — по биту на уровень: 0 — "L", 1 — "R"),
+    а не строку, так что спуск на уровень не копирует путь целиком.
+
+    Attributes:
+        value: Значение в узле.
+        depth: Глубина узла (0 — корень).
+        bits: Путь от корня в битах, старший бит — первый шаг.
+        height: Высота дерева (>= 1) или None для бесконечного дерева.
+    """
+
+    __slots__ = ("value", "depth", "bits", "height")
+
+    def __init__(self, root: int = 4, height: Optional[int] = None, path: str = "") -> None:
+        value = root
+        bits = 0
+        for step in path:
+            left_value, right_value = _children_variant4(value)
+            value = left_value if step == "L" else right_value
+            bits = bits << 1 | (step == "R")
+        self.value = value
+        self.depth = len(path)
+        self.bits = bits
+        self.height = height
+
+    @classmethod
+    def _child(cls, value: int, depth: int, bits: int, height: Optional[int]) -> "VirtualTree":
+        node = cls.__new__(cls)
+        node.value = value
+        node.depth = depth
+        node.bits = bits
+        node.height = height
+        return node
+
+    def _has_children(self) -> bool:
+        return self.height is None or self.depth + 1 < self.height
+
+    @property
+    def path(self) -> str:
+        """Путь от корня: строка из "L" и "R" ("" — корень), строится по запросу."""
+        if not self.depth:
+            return ""
+        return format(self.bits, f"0{self.depth}b").replace("0", "L").replace("1", "R")
+
+    @property
+    def left(self) -> Optional["VirtualTree"]:
+        """Левый потомок (value * 4) или None на последнем уровне."""
+        if not self._has_children():
+            return None
+        return self._child(_children_variant4(self.value)[0], self.depth + 1, self.bits << 1, self.height)
+
+    @property
+    def right(self) -> Optional["VirtualTree"]:
+        """Правый потомок (value + 1) или None на последнем уровне."""
+        if not self._has_children():
+            return None
+        return self._child(_children_variant4(self.value)[1], self.depth + 1, self.bits << 1 | 1, self.height)
+
+    def __repr__(self) -> str:
+        return f"VirtualTree(value={self.value}, path={self.path!r}, height={self.height})"
+
+
+def virtual_node(path: str = "", root: int = 4, height: Optional[int] = None) -> Optional[VirtualTree]:
+    """Узел виртуального дерева по пути от корня, без построения дерева.
+
+    Args:
+        path: Путь из символов "L" (левый) и "R" (правый).
+        root: Значение в корне.
+        height: Высота дерева (>= 1) или None — без ограничения.
+
+    Returns:
+        VirtualTree или None, если путь содержит другие символы,
+        высота некорректна или путь длиннее дерева.
+    """
+    if not isinstance(path, str) or set(path) - {"L", "R"}:
+        return None
+    if height is not None and (not isinstance(height, int) or len(path) >= height):
+        return None
+    return VirtualTree(root, height, path)
+
+
+# Совместное использование поддеревьев
+
+SHARE_CACHE_SIZE = 1 << 16
+
+
+def _shared_node(
+    value: int,
+    height: int,
+    build: NodeBuilder,
+    cache: Dict[Tuple[type, Any, int], TreeLike],
+) -> TreeLike:
+    """Поддерево (value, height) из кеша cache или построенное и запомненное."""
+    key = (type(value), value, height)
+    node = cache.get(key)
+    if node is not None:
+        return node
+    if height == 1:
+        node = build(value, None, None)
+    else:
+        left_value, right_value = _children_variant4(value)
+        node = build(
+            value,
+            _shared_node(left_value, height - 1, build, cache),
+            _shared_node(right_value, height - 1, build, cache),
+        )
+    if len(cache) < SHARE_CACHE_SIZE:
+        cache[key] = node
+    return node
+
+
+def _build_shared(height: int, value: int, build: NodeBuilder) -> TreeLike:
+    """Построить дерево как DAG: одинаковые поддеревья — один объект.
+
+    Поддерево определяется ключом (тип значения, значение, высота), так что
+    4 и 4.0 не смешиваются. Узлы неизменяемых контейнеров можно безопасно
+    включать в дерево многократно. Кеш поддеревьев локален для вызова
+    и освобождается при выходе из него; он хранит не больше SHARE_CACHE_SIZE
+    записей — остальные поддеревья просто строятся заново.
+    """
+    return _shared_node(value, height, build, {})
+
+
 # Генератор дерева
 
+def _build_subtree(height: int, value: int, build: NodeBuilder) -> TreeLike:
+    """Построить поддерево высоты height (>= 1) выбранным построителем."""
+    if height == 1:
+        return build(value, None, None)
+    left_value, right_value = _children_variant4(value)
+    return build(
+        value,
+        _build_subtree(height - 1, left_value, build),
+        _build_subtree(height - 1, right_value, build),
+    )
+
+
 def gen_bin_tree(
     height: int = 4,
     root: int = 4,
     *,
     container: str = "dict",
+    share: bool = False,
 ) -> Optional[TreeLike]:
     """Рекурсивно сгенерировать бинарное дерево (вариант 4).
 
     Порождает ровно `height` уровней (корень — уровень 1).
     На уровне `height` создаётся лист с потомками None.
+    Контейнер проверяется один раз до построения, каждый узел создаётся
+    сразу в нужном контейнере одной аллокацией (см. CONTAINERS).
 
     Args:
         height: Высота дерева (>=1). Если <1 — вернётся пустой словарь для
-            container="dict" или None для container="dataclass".
+            container="dict" или None для остальных контейнеров.
         root: Значение в корне.
-        container: "dict" или "dataclass" — тип контейнера узлов.
+        container: "dict", "dataclass", "tuple" ((value, left, right))
+            или "slots" (SlotNode) — тип контейнера узлов.
+        share: Построить дерево как DAG: одинаковые поддеревья
+            (одно значение и высота) — один и тот же объект.
+            Действует только для неизменяемых контейнеров
+            (IMMUTABLE_CONTAINERS); словари изменяемы и всегда строятся полностью.
 
     Returns:
-        Дерево в виде словаря или dataclass `Node`.
+        Дерево в выбранном контейнере.
         Если контейнер неизвестен или построение невозможно — None.
     """
+    build = CONTAINERS.get(container)
+    if build is None:
+        return None
+
+    if height < 1:
+        return build(root, None, None) if container == "dict" else None
+
+    if share and container in IMMUTABLE_CONTAINERS:
+        return _build_shared(height, root, build)
+    return _build_subtree(height, root, build)
+
+
+def _gen_bin_tree_legacy(
+    height: int = 4,
+    root: int = 4,
+    *,
+    container: str = "dict",
+) -> Optional[TreeLike]:
+    """Прежняя версия gen_bin_tree — только для сравнения в benchmark_containers.
+
+    Проверяет контейнер лишь на листьях и на каждом узле dataclass-дерева
+    проверяет тип поддеревьев.
+    """
     if height < 1:
         return {"value": root, "left": None, "right": None} if container == "dict" else None
 
@@ -67,8 +289,8 @@ def gen_bin_tree(
         return None
 
     left_value, right_value = _children_variant4(root)
-    left_sub = gen_bin_tree(height - 1, left_value, container=container)
-    right_sub = gen_bin_tree(height - 1, right_value, container=container)
+    left_sub = _gen_bin_tree_legacy(height - 1, left_value, container=container)
+    right_sub = _gen_bin_tree_legacy(height - 1, right_value, container=container)
 
     if left_sub is None or right_sub is None:
         return None
@@ -85,22 +307,161 @@ def gen_bin_tree(
 
 # Преобразования
 
+def _node_parts(node: TreeLike) -> Tuple[Any, Optional[TreeLike], Optional[TreeLike]]:
+    """Значение и потомки узла любого поддерживаемого контейнера."""
+    if isinstance(node, dict):
+        return node.get("value"), node.get("left"), node.get("right")
+    if isinstance(node, tuple):
+        return node
+    return node.value, node.left, node.right
+
+
+def _is_unbounded(tree: Any) -> bool:
+    """Дерево без последнего уровня (VirtualTree с height=None)."""
+    return isinstance(tree, VirtualTree) and tree.height is None
+
+
 def to_dict(tree: Optional[TreeLike]) -> DictTree:
-    """Преобразовать дерево любого поддерживаемого контейнера к словарю."""
-    if tree is None:
+    """Преобразовать дерево любого поддерживаемого контейнера к словарю.
+
+    Обход ведётся явным стеком, поэтому глубина дерева не ограничена
+    лимитом рекурсии. Бесконечное VirtualTree (height=None) не
+    преобразуется — возвращается {}.
+    """
+    if tree is None or _is_unbounded(tree):
         return {}
-    if isinstance(tree, dict):
-        return {
-            "value": tree.get("value"),
-            "left": to_dict(tree.get("left")),
-            "right": to_dict(tree.get("right")),
-        }
-    # dataclass Node
-    return {
-        "value": tree.value,
-        "left": to_dict(tree.left),
-        "right": to_dict(tree.right),
-    }
+    result: DictTree = {}
+    stack = [(tree, result)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        node, out = pop()
+        value, left, right = _node_parts(node)
+        left_out: DictTree = {}
+        right_out: DictTree = {}
+        out["value"] = value
+        out["left"] = left_out
+        out["right"] = right_out
+        if right is not None:
+            push((right, right_out))
+        if left is not None:
+            push((left, left_out))
+    return result
+
+
+TraversalOrder = Literal["pre", "in", "post", "level"]
+
+
+def _iter_pre(tree: TreeLike) -> Iterator[Any]:
+    stack = [tree]
+    while stack:
+        value, left, right = _node_parts(stack.pop())
+        yield value
+        if right:
+            stack.append(right)
+        if left:
+            stack.append(left)
+
+
+def _iter_in(tree: TreeLike) -> Iterator[Any]:
+    stack: List[TreeLike] = []
+    node: Optional[TreeLike] = tree
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = _node_parts(node)[1]
+        value, _, right = _node_parts(stack.pop())
+        yield value
+        node = right
+
+
+def _iter_post(tree: TreeLike) -> Iterator[Any]:
+    stack = [(tree, False)]
+    while stack:
+        node, expanded = stack.pop()
+        value, left, right = _node_parts(node)
+        if expanded:
+            yield value
+            continue
+        stack.append((node, True))
+        if right:
+            stack.append((right, False))
+        if left:
+            stack.append((left, False))
+
+
+def _iter_level(tree: TreeLike) -> Iterator[Any]:
+    queue = deque([tree])
+    while queue:
+        value, left, right = _node_parts(queue.popleft())
+        yield value
+        if left:
+            queue.append(left)
+        if right:
+            queue.append(right)
+
+
+_TRAVERSALS = {"pre": _iter_pre, "in": _iter_in, "post": _iter_post, "level": _iter_level}
+
+
+def iter_nodes(tree: Optional[TreeLike], order: TraversalOrder = "pre") -> Optional[Iterator[Any]]:
+    """Лениво обойти значения узлов дерева без рекурсии.
+
+    Работает для всех контейнеров (а также для результата to_dict)
+    на любой глубине: обход ведётся явным стеком или очередью. Пустой
+    словарь {} (отсутствующая ветвь в результате to_dict) узлом не считается.
+
+    Args:
+        tree: Дерево или None.
+        order: "pre" (прямой), "in" (симметричный), "post" (обратный)
+            или "level" (по уровням).
+
+    Returns:
+        Итератор значений узлов или None, если порядок обхода неизвестен
+        либо для бесконечного VirtualTree запрошен "in" или "post" (они не
+        выдали бы ни одного значения). "pre" и "level" на нём — бесконечные
+        ленивые итераторы.
+    """
+    traverse = _TRAVERSALS.get(order)
+    if traverse is None or order in ("in", "post") and _is_unbounded(tree):
+        return None
+    if not tree:
+        return iter(())
+    return traverse(tree)
+
+
+def tree_stats(tree: Optional[TreeLike]) -> Dict[str, int]:
+    """Посчитать логические и реально созданные узлы дерева.
+
+    Для дерева с общими поддеревьями (share=True) логических узлов
+    столько же, сколько в полном дереве, а созданных объектов — меньше.
+
+    Returns:
+        dict: 'logical' — узлы полного дерева, 'unique' — различные объекты,
+        'bytes' — суммарный размер различных объектов (sys.getsizeof).
+    """
+    if not tree:
+        return {"logical": 0, "unique": 0, "bytes": 0}
+
+    def children(node: TreeLike) -> list:
+        _, left, right = _node_parts(node)
+        return [k for k in (left, right) if k]
+
+    logical: Dict[int, int] = {}
+    size = 0
+    stack = [tree]
+    while stack:
+        node = stack[-1]
+        if id(node) in logical:
+            stack.pop()
+            continue
+        pending = [k for k in children(node) if id(k) not in logical]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        logical[id(node)] = 1 + sum(logical[id(k)] for k in children(node))
+        size += sys.getsizeof(node)
+    return {"logical": logical[id(tree)], "unique": len(logical), "bytes": size}
 
 
 def _dict_to_dataclass(tree: DictTree) -> Optional[Node]:
@@ -117,6 +478,196 @@ def _dict_to_dataclass(tree: DictTree) -> Optional[Node]:
 
 
 
+# Бинарная сериализация
+
+TREE_MAGIC = b"BTR1"
+_HEADER = struct.Struct("<4sI")   # сигнатура, высота
+_VALUE = struct.Struct("<q")      # значение узла: int64 little-endian
+MAX_PACKED_HEIGHT = 62
+_PACKED_BUILDERS: Dict[str, NodeBuilder] = CONTAINERS   # контейнеры materialize
+
+
+def _level_values(tree: TreeLike) -> Optional[Tuple[int, List[Any]]]:
+    """Высота и значения полного дерева по уровням; None — дерево неполное."""
+    values: List[Any] = []
+    level = [tree]
+    height = 0
+    while level:
+        height += 1
+        if height > MAX_PACKED_HEIGHT:
+            return None
+        children: List[TreeLike] = []
+        for node in level:
+            value, left, right = _node_parts(node)
+            values.append(value)
+            if left and right:
+                children.append(left)
+                children.append(right)
+            elif left or right:
+                return None
+        if children and len(children) != 2 * len(level):
+            return None
+        level = children
+    return height, values
+
+
+def dump_tree(tree: Optional[TreeLike], path: str) -> Optional[int]:
+    """Записать полное дерево в компактный бинарный файл.
+
+    Формат: заголовок (сигнатура TREE_MAGIC, высота uint32), затем
+    2**height - 1 значений int64 little-endian в порядке обхода по уровням.
+    Потомки узла i лежат в позициях 2i+1 и 2i+2, поэтому ссылки не хранятся.
+
+    Args:
+        tree: Дерево любого поддерживаемого контейнера.
+        path: Путь к файлу.
+
+    Returns:
+        Размер файла в байтах или None, если дерево пустое или неполное
+        (в том числе бесконечное VirtualTree), либо значения не целые
+        или не помещаются в int64.
+    """
+    if not tree or _is_unbounded(tree):
+        return None
+    levels = _level_values(tree)
+    if levels is None:
+        return None
+    height, values = levels
+    try:
+        packed = array("q", values)
+    except (OverflowError, TypeError):
+        return None
+    if sys.byteorder != "little":
+        packed.byteswap()
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(TREE_MAGIC, height))
+        packed.tofile(f)
+    return _HEADER.size + _VALUE.size * len(packed)
+
+
+class PackedTree:
+    """Узел дерева из файла dump_tree: значения читаются из mmap по индексу.
+
+    Навигация (.value, .left, .right) как у Node, но объекты создаются
+    только для посещённых узлов; остальное дерево остаётся в файле.
+
+    Attributes:
+        index: Позиция узла в порядке обхода по уровням (корень — 0).
+        height: Высота всего дерева.
+    """
+
+    __slots__ = ("_buf", "_size", "index", "height")
+
+    def __init__(self, buf: mmap.mmap, index: int, height: int) -> None:
+        self._buf = buf
+        self._size = (1 << height) - 1
+        self.index = index
+        self.height = height
+
+    @property
+    def value(self) -> int:
+        return _VALUE.unpack_from(self._buf, _HEADER.size + _VALUE.size * self.index)[0]
+
+    def _child(self, index: int) -> Optional["PackedTree"]:
+        return PackedTree(self._buf, index, self.height) if index < self._size else None
+
+    @property
+    def left(self) -> Optional["PackedTree"]:
+        return self._child(2 * self.index + 1)
+
+    @property
+    def right(self) -> Optional["PackedTree"]:
+        return self._child(2 * self.index + 2)
+
+    def __len__(self) -> int:
+        """Число узлов во всём дереве."""
+        return self._size
+
+    def materialize(self, container: str = "dict") -> Optional[TreeLike]:
+        """Построить поддерево этого узла в контейнере из _PACKED_BUILDERS (иначе None).
+
+        Из файла читаются только значения поддерева: на глубине d это отрезок
+        [2^d·(i+1) − 1, 2^d·(i+1) + 2^d − 2] для узла i. Узлы создаются
+        снизу вверх, по уровню за раз.
+        """
+        build = _PACKED_BUILDERS.get(container)
+        if build is None:
+            return None
+        levels: List[array] = []
+        first, count = self.index, 1
+        while first < self._size:
+            start = _HEADER.size + _VALUE.size * first
+            level = array("q")
+            level.frombytes(self._buf[start:start + _VALUE.size * count])
+            if sys.byteorder != "little":
+                level.byteswap()
+            levels.append(level)
+            first, count = 2 * first + 1, 2 * count
+        below = [build(value, None, None) for value in levels[-1]]
+        for level in reversed(levels[:-1]):
+            below = [build(value, below[2 * k], below[2 * k + 1]) for k, value in enumerate(level)]
+        return below[0]
+
+    def close(self) -> None:
+        """Освободить отображение файла; узлы после этого недоступны."""
+        self._buf.close()
+
+    def __repr__(self) -> str:
+        return f"PackedTree(index={self.index}, height={self.height})"
+
+
+def load_tree(path: str) -> Optional[PackedTree]:
+    """Открыть файл dump_tree через mmap без построения объектов.
+
+    Returns:
+        Корень PackedTree или None, если файла нет или формат не совпадает.
+    """
+    try:
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(buf) >= _HEADER.size:
+        magic, height = _HEADER.unpack_from(buf)
+        if (magic == TREE_MAGIC and 1 <= height <= MAX_PACKED_HEIGHT
+                and len(buf) == _HEADER.size + _VALUE.size * ((1 << height) - 1)):
+            return PackedTree(buf, 0, height)
+    buf.close()
+    return None
+
+
+def benchmark_containers(height: int = 12, repeat: int = 5) -> List[Dict[str, Any]]:
+    """Сравнить построение дерева в разных контейнерах: время и аллокации.
+
+    Строки "legacy" — прежняя реализация (_gen_bin_tree_legacy) для тех
+    контейнеров, которые она поддерживала.
+
+    Returns:
+        Список строк: 'impl', 'container', 'ms' (медиана одного построения),
+        'blocks' и 'bytes' — число и объём аллокаций, живых после построения.
+    """
+    impls = [("legacy", _gen_bin_tree_legacy, ("dict", "dataclass")),
+             ("builder", gen_bin_tree, tuple(CONTAINERS))]
+    rows: List[Dict[str, Any]] = []
+    for impl, func, containers in impls:
+        for container in containers:
+            samples = timeit.repeat(
+                lambda: func(height, 4, container=container), repeat=repeat, number=1
+            )
+            tracemalloc.start()
+            tree = func(height, 4, container=container)
+            stats = tracemalloc.take_snapshot().statistics("filename")
+            tracemalloc.stop()
+            del tree
+            rows.append({
+                "impl": impl,
+                "container": container,
+                "ms": 1000.0 * statistics.median(samples),
+                "blocks": sum(s.count for s in stats),
+                "bytes": sum(s.size for s in stats),
+            })
+    return rows
+
 
 if __name__ == "__main__":
     t_dict = gen_bin_tree()
@@ -127,3 +678,15 @@ if __name__ == "__main__":
 
     print("\nDATACLASS:")
     print(to_dict(t_dc))
+
+    deep = virtual_node("L" * 30 + "R" * 29, root=1, height=60)
+    print(f"\nVirtualTree, высота 60: узел {deep.path[:4]}... = {deep.value}")
+
+    for share in (False, True):
+        stats = tree_stats(gen_bin_tree(height=16, root=0, container="dataclass", share=share))
+        print(f"\nshare={share}: {stats}")
+
+    print(f"\n{'реализация':>10} | {'контейнер':>9} | {'мс':>7} | {'блоков':>7} | {'байт':>9}")
+    for row in benchmark_containers(height=14):
+        print(f"{row['impl']:>10} | {row['container']:>9} | {row['ms']:7.2f} | "
+              f"{row['blocks']:7d} | {row['bytes']:9d}")
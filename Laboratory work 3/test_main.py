@@ -1,10 +1,21 @@
+import gc
+import os
+import tempfile
+import tracemalloc
 import unittest
 
 
 from main import (
+    dump_tree,
     gen_bin_tree,
+    load_tree,
+    iter_nodes,
     to_dict,
+    tree_stats,
+    virtual_node,
     Node,
+    SlotNode,
+    VirtualTree,
 )
 
 
@@ -108,5 +119,223 @@ class TestGenBinTree(unittest.TestCase):
         self.assertEqual(self.depth_dict(t), 6)
 
 
+class TestContainers(unittest.TestCase):
+
+    def test_all_containers_same_structure(self):
+        """tuple и slots дают ту же структуру, что dict."""
+        expected = to_dict(gen_bin_tree(height=5, container="dict"))
+        for container in ("dataclass", "tuple", "slots"):
+            self.assertEqual(to_dict(gen_bin_tree(height=5, container=container)), expected)
+
+    def test_tuple_and_slots_types(self):
+        """Узлы создаются сразу в нужном контейнере."""
+        t = gen_bin_tree(height=3, root=4, container="tuple")
+        self.assertEqual(t[0], 4)
+        self.assertEqual(t[1][0], 16)
+        self.assertEqual(t[1][1][1], None)
+        s = gen_bin_tree(height=3, root=4, container="slots")
+        self.assertIsInstance(s.left, SlotNode)
+        self.assertFalse(hasattr(s, "__dict__"))
+
+    def test_share_for_immutable_containers(self):
+        """share=True работает для всех неизменяемых контейнеров."""
+        for container in ("tuple", "slots"):
+            t = gen_bin_tree(height=10, root=0, container=container, share=True)
+            self.assertEqual(to_dict(t), to_dict(gen_bin_tree(height=10, root=0, container="dict")))
+            self.assertLess(tree_stats(t)["unique"], 2 ** 10 - 1)
+
+
+class TestTraversal(unittest.TestCase):
+
+    def test_orders_on_small_tree(self):
+        """Все порядки обхода на дереве высоты 3 с корнем 4."""
+        t = gen_bin_tree(height=3, root=4)
+        self.assertEqual(list(iter_nodes(t, "pre")), [4, 16, 64, 17, 5, 20, 6])
+        self.assertEqual(list(iter_nodes(t, "in")), [64, 16, 17, 4, 20, 5, 6])
+        self.assertEqual(list(iter_nodes(t, "post")), [64, 17, 16, 20, 6, 5, 4])
+        self.assertEqual(list(iter_nodes(t, "level")), [4, 16, 5, 64, 17, 20, 6])
+
+    def test_same_order_for_all_containers(self):
+        """Обход не зависит от контейнера (и работает на результате to_dict)."""
+        expected = list(iter_nodes(gen_bin_tree(height=5), "in"))
+        for container in ("dataclass", "tuple", "slots"):
+            self.assertEqual(list(iter_nodes(gen_bin_tree(height=5, container=container), "in")), expected)
+        self.assertEqual(list(iter_nodes(to_dict(gen_bin_tree(height=5)), "in")), expected)
+
+    def test_unknown_order_and_empty_tree(self):
+        self.assertIsNone(iter_nodes(gen_bin_tree(), "zigzag"))
+        self.assertEqual(list(iter_nodes(None)), [])
+
+    def test_deep_degenerate_tree(self):
+        """Вырожденное дерево глубже лимита рекурсии обрабатывается без RecursionError."""
+        depth = 50_000
+        chain = None
+        for value in range(depth):
+            chain = Node(value, chain, None)
+        as_dict = to_dict(chain)
+        self.assertEqual(as_dict["value"], depth - 1)
+        self.assertEqual(sum(1 for _ in iter_nodes(as_dict, "post")), depth)
+        self.assertEqual(next(iter_nodes(chain, "in")), 0)
+
+
+class TestSharedSubtrees(unittest.TestCase):
+
+    def test_shared_tree_equals_full_tree(self):
+        """share=True даёт то же дерево, что и обычное построение."""
+        for root in (0, 1, 4):
+            full = gen_bin_tree(height=7, root=root, container="dataclass")
+            shared = gen_bin_tree(height=7, root=root, container="dataclass", share=True)
+            self.assertEqual(shared, full)
+            self.assertEqual(to_dict(shared), to_dict(full))
+
+    def test_identical_subtrees_are_one_object(self):
+        """Для корня 0 пути LLRL и RRRR ведут к значению 4 — это один объект."""
+        t = gen_bin_tree(height=12, root=0, container="dataclass", share=True)
+        self.assertIs(t.left.left.right.left, t.right.right.right.right)
+        stats = tree_stats(t)
+        self.assertEqual(stats["logical"], 2 ** 12 - 1)
+        self.assertLess(stats["unique"], stats["logical"])
+        self.assertLess(stats["bytes"], tree_stats(gen_bin_tree(height=12, root=0, container="dataclass"))["bytes"])
+
+    def test_shared_cache_freed_with_tree(self):
+        """Кеш поддеревьев не переживает вызов: DAG занимает меньше полного дерева."""
+        def retained(share):
+            gc.disable()
+            tracemalloc.start()
+            try:
+                tree = gen_bin_tree(height=14, container="slots", share=share)
+                size = tracemalloc.get_traced_memory()[0]
+                del tree
+                return size, tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+                gc.enable()
+
+        full, _ = retained(False)
+        shared, after_del = retained(True)
+        self.assertLess(shared, full)
+        self.assertLess(after_del, 10_000)
+
+    def test_value_type_is_part_of_key(self):
+        """4 и 4.0 — разные поддеревья."""
+        gen_bin_tree(height=3, root=4, container="tuple", share=True)
+        t = gen_bin_tree(height=3, root=4.0, container="tuple", share=True)
+        self.assertEqual(t, gen_bin_tree(height=3, root=4.0, container="tuple"))
+        self.assertIs(type(t[0]), float)
+        self.assertIs(type(t[1][2][0]), float)
+
+    def test_share_ignored_for_dict(self):
+        """Словари изменяемы — share на них не влияет."""
+        t = gen_bin_tree(height=5, root=0, container="dict", share=True)
+        self.assertEqual(tree_stats(t)["unique"], 2 ** 5 - 1)
+
+
+class TestVirtualTree(unittest.TestCase):
+
+    def test_matches_materialized_tree(self):
+        """Виртуальное дерево заданной высоты совпадает с построенным."""
+        for height in (1, 2, 4, 6):
+            self.assertEqual(to_dict(VirtualTree(height=height)), to_dict(gen_bin_tree(height=height)))
+
+    def test_navigation_like_node(self):
+        v = VirtualTree(height=3)
+        self.assertEqual((v.value, v.left.value, v.right.value), (4, 16, 5))
+        self.assertEqual(v.left.right.value, 17)
+        self.assertIsNone(v.left.left.left)
+        self.assertIsNone(v.right.right.right)
+
+    def test_children_not_stored(self):
+        """Потомки вычисляются при каждом обращении и не сохраняются."""
+        v = VirtualTree()
+        self.assertIsNot(v.left, v.left)
+        self.assertFalse(hasattr(v, "__dict__"))
+
+    def test_unbounded_tree_does_not_hang(self):
+        """Бесконечное дерево: to_dict -> {}, in/post -> None, pre/level — ленивые."""
+        v = VirtualTree()
+        self.assertEqual(to_dict(v), {})
+        self.assertIsNone(iter_nodes(v, "in"))
+        self.assertIsNone(iter_nodes(v, "post"))
+        level = iter_nodes(v, "level")
+        self.assertEqual([next(level) for _ in range(3)], [4, 16, 5])
+
+    def test_virtual_node_by_path(self):
+        self.assertEqual(virtual_node("LR").value, 17)
+        self.assertEqual(virtual_node("LR", height=3).path, "LR")
+        node = virtual_node("RLR").left.right
+        self.assertEqual((node.depth, node.path), (5, "RLRLR"))
+        self.assertEqual(VirtualTree().path, "")
+        self.assertEqual(virtual_node("").value, 4)
+
+    def test_height_60_path(self):
+        """Узел на глубине 60 вычисляется без построения дерева."""
+        node = virtual_node("L" * 59, root=1, height=60)
+        self.assertEqual(node.value, 4 ** 59)
+        self.assertIsNone(node.left)
+        self.assertEqual(virtual_node("R" * 59, root=1, height=60).value, 60)
+
+    def test_invalid_input(self):
+        self.assertIsNone(virtual_node("LX"))
+        self.assertIsNone(virtual_node("LRL", height=3))
+        self.assertIsNone(virtual_node("", height=0))
+
+
+class TestBinaryFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "tree.bin")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_roundtrip_all_containers(self):
+        """dump_tree/load_tree сохраняют дерево любого контейнера."""
+        for container in ("dict", "dataclass", "tuple", "slots"):
+            tree = gen_bin_tree(height=5, container=container)
+            self.assertEqual(dump_tree(tree, self.path), 8 + 8 * 31)
+            packed = load_tree(self.path)
+            self.assertEqual(to_dict(packed), to_dict(tree))
+            self.assertEqual(packed.materialize(container), tree)
+            packed.close()
+
+    def test_lazy_navigation(self):
+        dump_tree(VirtualTree(height=16), self.path)
+        packed = load_tree(self.path)
+        self.assertEqual((packed.height, len(packed)), (16, 2 ** 16 - 1))
+        self.assertEqual(packed.left.right.value, 17)
+        self.assertEqual(packed.right.materialize("tuple"), gen_bin_tree(height=15, root=5, container="tuple"))
+        self.assertEqual(list(iter_nodes(packed, "level"))[:7], [4, 16, 5, 64, 17, 20, 6])
+        packed.close()
+
+    def test_materialize_subtree_only(self):
+        """materialize строит только поддерево узла: лист — один узел."""
+        tree = gen_bin_tree(height=6)
+        dump_tree(tree, self.path)
+        packed = load_tree(self.path)
+        leaf = packed
+        while leaf.left is not None:
+            leaf = leaf.left
+        self.assertEqual(leaf.materialize(), {"value": 4 ** 6, "left": None, "right": None})
+        self.assertEqual(packed.right.left.materialize(), tree["right"]["left"])
+        self.assertIsNone(packed.materialize("unknown"))
+        packed.close()
+
+    def test_rejects_unpackable_trees(self):
+        """Неполное дерево и значения вне int64 не записываются."""
+        incomplete = {"value": 1, "left": {"value": 4, "left": None, "right": None}, "right": None}
+        self.assertIsNone(dump_tree(incomplete, self.path))
+        self.assertIsNone(dump_tree(gen_bin_tree(height=2, root=2 ** 62), self.path))
+        self.assertIsNone(dump_tree(VirtualTree(), self.path))
+        self.assertIsNone(dump_tree(None, self.path))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_rejects_bad_files(self):
+        self.assertIsNone(load_tree(os.path.join(self.tmp.name, "missing.bin")))
+        with open(self.path, "wb") as f:
+            f.write(b"not a tree file")
+        self.assertIsNone(load_tree(self.path))
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
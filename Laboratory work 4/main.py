@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import bisect
+import math
+import os
+import random
 import sys
 import statistics
 import timeit
-from typing import Iterable, List, Dict, Callable, Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Dict, Callable, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 
 # ВСПОМОГАТЕЛЬНОЕ
@@ -63,6 +70,165 @@ def fact_iterative(n: int) -> Optional[int]:
     return result
 
 
+def _iter_factorials(targets: List[int]) -> Iterator[Tuple[int, int]]:
+    """Пройти по возрастающим `targets` одним проходом, выдавая (n, n!).
+
+    Промежуточное произведение не пересчитывается: между соседними
+    целями домножается только отрезок (предыдущая, текущая].
+    """
+    k, product = 1, 1
+    for n in targets:
+        if n > k:
+            product *= _range_product(k + 1, n)
+            k = n
+        yield n, product
+
+
+def fact_many(ns: Iterable[object]) -> List[Optional[int]]:
+    """Вычислить факториалы для набора `n` за один возрастающий проход.
+
+    Корректные значения сортируются без повторов, и факториалы считаются
+    одним проходом до max(ns): O(max(ns)) умножений вместо O(Σ ns)
+    при вызове `fact_iterative` для каждого n.
+
+    Args:
+        ns: Набор значений n в любом порядке, возможны повторы.
+
+    Returns:
+        list[int | None]: Факториалы в порядке входа;
+        `None` — для некорректных элементов.
+    """
+    ns = list(ns)
+    targets = sorted({n for n in ns if _is_valid_n(n)})
+    known = dict(_iter_factorials(targets))
+    return [known[n] if _is_valid_n(n) else None for n in ns]
+
+
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def _is_prime(p: int) -> bool:
+    """Тест Миллера — Рабина; с базами _MR_BASES детерминирован для p < 3.3·10²⁴."""
+    if p < 2:
+        return False
+    for q in _MR_BASES:
+        if p % q == 0:
+            return p == q
+    d, r = p - 1, 0
+    while not d & 1:
+        d >>= 1
+        r += 1
+    for a in _MR_BASES:
+        x = pow(a, d, p)
+        if x in (1, p - 1):
+            continue
+        for _ in range(r - 1):
+            x = x * x % p
+            if x == p - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def fact_mod(n: int, p: int) -> Optional[int]:
+    """Вычислить n! mod p, не строя само n!.
+
+    - n >= p: p входит в произведение, ответ 0;
+    - p простое и n > p / 2: по теореме Вильсона (p-1)! ≡ -1 (mod p),
+      поэтому n! ≡ -1 / ((n+1)·…·(p-1)) — меньше p/2 умножений;
+    - иначе — цикл по [2, n] с приведением по модулю.
+
+    Args:
+        n (int): Неотрицательное целое число.
+        p (int): Модуль (>= 1).
+
+    Returns:
+        int | None: Значение `n! mod p` либо `None`, если `n` или `p` некорректны.
+    """
+    if not _is_valid_n(n) or not isinstance(p, int) or p < 1:
+        return None
+    if n >= p:
+        return 0
+    if 2 * n > p and _is_prime(p):
+        tail = 1
+        for k in range(n + 1, p):
+            tail = tail * k % p
+        return (p - 1) * pow(tail, -1, p) % p
+    result = 1
+    for k in range(2, n + 1):
+        result = result * k % p
+    return result % p
+
+
+# До этого n значения log_fact берутся из таблицы накопленных сумм ln k
+LOG_FACT_TABLE_MAX = 1 << 20
+# Таблицу выгодно расширять, если в пакете не меньше одного значения на столько её элементов
+LOG_FACT_TABLE_DENSITY = 32
+
+# _log_fact_table[k] = ln(k!); растёт по мере надобности и живёт между вызовами
+_log_fact_table = np.zeros(1)
+
+
+def _log_fact_upto(m: int) -> np.ndarray:
+    """Таблица ln(k!) для k = 0..m (не короче): достраивает кешированную."""
+    global _log_fact_table
+    size = _log_fact_table.size
+    if m >= size:
+        grown = min(max(m + 1, 2 * size), LOG_FACT_TABLE_MAX + 1)
+        tail = np.log(np.arange(size, grown, dtype=np.float64))
+        _log_fact_table = np.concatenate(
+            (_log_fact_table, _log_fact_table[-1] + np.cumsum(tail)))
+    return _log_fact_table
+
+
+def _as_float(v: object) -> float:
+    try:
+        return float(v)
+    except OverflowError:
+        return math.inf
+
+
+def log_fact(ns: object) -> Union[float, np.ndarray]:
+    """Вычислить ln(n!) для числа или целого массива значений.
+
+    Небольшие n берутся из таблицы cumsum(ln k), кешированной между вызовами
+    (до LOG_FACT_TABLE_MAX); таблица расширяется, только если пакет
+    достаточно плотный (LOG_FACT_TABLE_DENSITY), иначе и для больших n —
+    math.lgamma(n + 1). Точное n! не строится.
+
+    Args:
+        ns: Целое число или массив (список, кортеж, ndarray) целых чисел.
+
+    Returns:
+        float | np.ndarray: ln(n!) той же формы, что и вход;
+        NaN — для некорректных элементов (не целое или n < 0).
+    """
+    # списки проверяются поэлементно: общий dtype превратил бы 3 в 3.0 или '3'
+    values = ns if isinstance(ns, np.ndarray) else np.asarray(ns, dtype=object)
+    if values.dtype.kind in "iu":
+        valid = values >= 0
+        n = values.astype(np.float64)
+    else:
+        flat = values.ravel().tolist()
+        ok = [_is_valid_n(v) or isinstance(v, np.integer) and v >= 0 for v in flat]
+        valid = np.array(ok, dtype=bool).reshape(values.shape)
+        n = np.array([_as_float(v) if good else 0.0 for v, good in zip(flat, ok)],
+                     dtype=np.float64).reshape(values.shape)
+
+    result = np.full(values.shape, np.nan)
+    small = valid & (n <= LOG_FACT_TABLE_MAX)
+    if small.any():
+        idx = n[small].astype(np.int64)
+        top = int(idx.max())
+        if top < _log_fact_table.size or idx.size * LOG_FACT_TABLE_DENSITY >= top:
+            result[small] = _log_fact_upto(top)[idx]
+            valid = valid & ~small
+    if valid.any():
+        result[valid] = [math.lgamma(x + 1.0) for x in n[valid]]
+    return float(result) if result.ndim == 0 else result
+
+
 def benchmark_single(func: Callable[[int], Optional[int]], n: int, repeat: int = 10) -> float:
     """Измерить «чистое» время одного вызова функции.
 
@@ -82,11 +248,312 @@ def benchmark_single(func: Callable[[int], Optional[int]], n: int, repeat: int =
     return statistics.median(samples)
 
 
+def _range_product(lo: int, hi: int, step: int = 1) -> int:
+    """Произведение lo × (lo+step) × ... (не больше hi) сбалансированным деревом.
+
+    Диапазон делится пополам по числу множителей, поэтому перемножаются
+    числа близкой длины и большие умножения идут по Карацубе.
+    Глубина рекурсии — O(log((hi - lo) / step)).
+    """
+    if lo > hi:
+        return 1
+    count = (hi - lo) // step + 1
+    if count <= 8:
+        result = lo
+        for k in range(lo + step, hi + 1, step):
+            result *= k
+        return result
+    mid = lo + (count // 2) * step
+    return _range_product(lo, mid - step, step) * _range_product(mid, hi, step)
+
+
+def _balanced_product(values: List[int]) -> int:
+    """Произведение списка попарным (сбалансированным) перемножением."""
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def fact_binary_split(n: int) -> Optional[int]:
+    """Вычислить факториал методом двоичного разбиения.
+
+    n! = 2^(n - popcount(n)) × O(n), где нечётная часть
+    O(n) = Π_i oddprod(1 .. n >> i). Произведения нечётных чисел на каждом
+    уровне считаются сбалансированным деревом (`_range_product`),
+    степень двойки добавляется сдвигом.
+
+    Args:
+        n (int): Неотрицательное целое число.
+
+    Returns:
+        int | None: Значение `n!` либо `None`, если `n` некорректен.
+    """
+    if not _is_valid_n(n):
+        return None
+    inner = outer = 1
+    for i in range(n.bit_length() - 1, -1, -1):
+        lo = (n >> (i + 1)) + 1 | 1
+        hi = n >> i
+        if not hi & 1:
+            hi -= 1
+        inner *= _range_product(lo, hi, 2)
+        outer *= inner
+    return outer << (n - bin(n).count("1"))
+
+
+def _primes_upto(n: int) -> List[int]:
+    """Простые числа не больше `n` (решето Эратосфена)."""
+    if n < 2:
+        return []
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, int(n ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [p for p in range(2, n + 1) if sieve[p]]
+
+
+def _swing(n: int, primes: List[int]) -> int:
+    """Качающийся факториал n≀ = n! / ((n // 2)!)² через разложение на простые.
+
+    Показатель простого p равен Σ_k (⌊n / p^k⌋ mod 2); простые из (n/2, n]
+    входят ровно в первой степени.
+    """
+    factors: List[int] = []
+    for p in primes:
+        if p > n:
+            break
+        q, e = n, 0
+        while q:
+            q //= p
+            e += q & 1
+        if e:
+            factors.append(p if e == 1 else p ** e)
+    return _balanced_product(factors)
+
+
+def fact_prime_swing(n: int) -> Optional[int]:
+    """Вычислить факториал алгоритмом «prime swing» (Шёнхаге — Лушны).
+
+    n! = ((n // 2)!)² × n≀; качающийся факториал n≀ собирается из степеней
+    простых сбалансированным произведением. Решето строится один раз,
+    уровни n, n // 2, ... проходятся циклом, без рекурсии.
+
+    Args:
+        n (int): Неотрицательное целое число.
+
+    Returns:
+        int | None: Значение `n!` либо `None`, если `n` некорректен.
+    """
+    if not _is_valid_n(n):
+        return None
+    primes = _primes_upto(n)
+    levels: List[int] = []
+    m = n
+    while m >= 2:
+        levels.append(m)
+        m //= 2
+    result = 1
+    for m in reversed(levels):
+        result = result * result * _swing(m, primes)
+    return result
+
+
+def fact_recursive_halving(n: int) -> Optional[int]:
+    """Вычислить факториал рекурсивно, деля диапазон множителей пополам.
+
+    n! = P(2, m) × P(m + 1, n), где P — произведение диапазона, m — середина;
+    каждая половина считается так же (`_range_product`). Глубина рекурсии
+    O(log n) вместо n у `fact_recursive`, поэтому функция работает
+    и для n порядка миллионов.
+
+    Args:
+        n (int): Неотрицательное целое число.
+
+    Returns:
+        int | None: Значение `n!` либо `None`, если `n` некорректен.
+    """
+    if not _is_valid_n(n):
+        return None
+    return _range_product(2, n)
+
+
+# Ниже этого n накладные расходы на процессы превышают выигрыш: считаем последовательно
+PARALLEL_MIN_N = 50_000
+
+
+def _log_balanced_ranges(lo: int, hi: int, parts: int) -> List[Tuple[int, int]]:
+    """Разбить [lo, hi] на `parts` отрезков с примерно равной суммой ln k.
+
+    Длина произведения отрезка в битах пропорциональна Σ ln k, поэтому
+    границы подбираются по W(x) = x ln x - x (первообразная ln x):
+    к концу диапазона отрезки короче, а работа в них — одинаковая.
+    """
+    def weight(x: float) -> float:
+        return x * math.log(x) - x
+
+    w_lo, w_hi = weight(lo), weight(hi)
+    bounds = [lo - 1]
+    for i in range(1, parts):
+        target = w_lo + (w_hi - w_lo) * i / parts
+        left, right = bounds[-1] + 1, hi
+        while left < right:
+            mid = (left + right) // 2
+            if weight(mid) < target:
+                left = mid + 1
+            else:
+                right = mid
+        if left < hi:
+            bounds.append(left)
+    bounds.append(hi)
+    return [(bounds[i] + 1, bounds[i + 1]) for i in range(len(bounds) - 1)]
+
+
+def fact_parallel(n: int, workers: Optional[int] = None) -> Optional[int]:
+    """Вычислить факториал в пуле процессов.
+
+    [2, n] делится на `workers` отрезков с равной «логарифмической» работой
+    (`_log_balanced_ranges`), их произведения считаются параллельно
+    (`ProcessPoolExecutor`) и сливаются сбалансированным деревом.
+    При n < PARALLEL_MIN_N или одном процессе считается последовательно.
+
+    Args:
+        n (int): Неотрицательное целое число.
+        workers (int | None): Число процессов (>= 1); None — по числу ядер.
+
+    Returns:
+        int | None: Значение `n!` либо `None`, если `n` или `workers` некорректны.
+    """
+    if not _is_valid_n(n):
+        return None
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers < 1:
+        return None
+    if n < PARALLEL_MIN_N or workers == 1:
+        return _range_product(2, n)
+
+    ranges = _log_balanced_ranges(2, n, workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_range_product, *zip(*ranges)))
+    return _balanced_product(parts)
+
+
+class FactorialCache:
+    """Кеш факториалов с контрольными точками и LRU-вытеснением по объёму.
+
+    Хранятся только значения k! для k, кратных `step`. Запрос n! продолжает
+    произведение от ближайшей меньшей контрольной точки (поиск — bisect),
+    попутно сохраняя пройденные точки. Когда суммарный размер значений
+    превышает `max_bytes`, вытесняются давно не использованные точки.
+
+    Attributes:
+        step: Шаг контрольных точок.
+        max_bytes: Бюджет памяти на хранимые значения (sys.getsizeof).
+        exact: Запросы, попавшие ровно в контрольную точку.
+        partial: Запросы, продолженные от контрольной точки > 0.
+        cold: Запросы, посчитанные с нуля.
+    """
+
+    def __init__(self, step: int = 1000, max_bytes: int = 64 << 20) -> None:
+        self.step = max(1, step)
+        self.max_bytes = max_bytes
+        self._values: "OrderedDict[int, int]" = OrderedDict()
+        self._keys: List[int] = []
+        self._bytes = 0
+        self.exact = self.partial = self.cold = 0
+
+    def _store(self, k: int, value: int) -> None:
+        size = sys.getsizeof(value)
+        if size > self.max_bytes or k in self._values:
+            return
+        self._values[k] = value
+        bisect.insort(self._keys, k)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            old, old_value = self._values.popitem(last=False)
+            del self._keys[bisect.bisect_left(self._keys, old)]
+            self._bytes -= sys.getsizeof(old_value)
+
+    def get(self, n: int) -> Optional[int]:
+        """Вернуть `n!` либо `None`, если `n` некорректен."""
+        if not _is_valid_n(n):
+            return None
+        if n in self._values:
+            self.exact += 1
+            self._values.move_to_end(n)
+            return self._values[n]
+
+        pos = bisect.bisect_right(self._keys, n) - 1
+        if pos >= 0:
+            k = self._keys[pos]
+            result = self._values[k]
+            self._values.move_to_end(k)
+            self.partial += 1
+        else:
+            k, result = 0, 1
+            self.cold += 1
+
+        checkpoint = (k // self.step + 1) * self.step
+        while checkpoint <= n:
+            result *= _range_product(k + 1, checkpoint)
+            k = checkpoint
+            self._store(k, result)
+            checkpoint += self.step
+        return result * _range_product(k + 1, n)
+
+    def stats(self) -> Dict[str, float]:
+        """Счётчики запросов, доля попаданий и занятая память.
+
+        Returns:
+            dict: 'exact', 'partial', 'cold', 'hit_rate' (доля запросов,
+            обслуженных из кеша — точно или продолжением), 'entries', 'bytes'.
+        """
+        total = self.exact + self.partial + self.cold
+        return {
+            "exact": self.exact,
+            "partial": self.partial,
+            "cold": self.cold,
+            "hit_rate": (self.exact + self.partial) / total if total else 0.0,
+            "entries": len(self._values),
+            "bytes": self._bytes,
+        }
+
+
+# Реализации, участвующие в benchmark_series (ключ -> функция) и их подписи
+BENCH_FUNCS: Dict[str, Callable[[int], Optional[int]]] = {
+    "iterative": fact_iterative,
+    "recursive": fact_recursive,
+    "recursive_halving": fact_recursive_halving,
+    "binary_split": fact_binary_split,
+    "prime_swing": fact_prime_swing,
+}
+
+BENCH_LABELS: Dict[str, str] = {
+    "iterative": "Итеративная",
+    "recursive": "Рекурсивная",
+    "recursive_halving": "Рекурсивная (деление пополам)",
+    "binary_split": "Двоичное разбиение",
+    "prime_swing": "Prime swing",
+}
+
+# Реализации с глубиной рекурсии n: меряются только при n <= лимит - RECURSION_BUFFER
+DEPTH_LIMITED = frozenset({"recursive"})
+RECURSION_BUFFER = 50
+
+
 def benchmark_series(ns: Iterable[int], repeats: int = 5) -> Dict[str, List[float]]:
     """Провести серию измерений на фиксированном наборе `n`.
 
-    Для каждого `n` выполняется несколько измерений обеих реализаций
-    и берётся медиана. Один и тот же набор `n` используется для обеих функций.
+    Для каждого `n` выполняется несколько измерений каждой реализации
+    из BENCH_FUNCS и берётся медиана. Один и тот же набор `n`
+    используется для всех функций; реализации из DEPTH_LIMITED при n,
+    близком к лимиту рекурсии, не запускаются — в точку пишется NaN.
 
     Args:
         ns: Набор входных значений `n` (фиксированный список).
@@ -95,21 +562,98 @@ def benchmark_series(ns: Iterable[int], repeats: int = 5) -> Dict[str, List[floa
     Returns:
         dict: Согласованные списки:
             - 'n' — значения n;
-            - 'iterative_ms' — времена итеративной версии (мс, медиана);
-            - 'recursive_ms' — времена рекурсивной версии (мс, медиана).
+            - '<ключ>_ms' для каждого ключа BENCH_FUNCS ('iterative_ms',
+              'recursive_ms', 'recursive_halving_ms', 'binary_split_ms',
+              'prime_swing_ms') — времена реализации (мс, медиана; NaN — не мерилось).
     """
     ns = list(ns)
-    iter_times_ms: List[float] = []
-    rec_times_ms: List[float] = []
+    series: Dict[str, List[float]] = {"n": ns}
+    for key in BENCH_FUNCS:
+        series[f"{key}_ms"] = []
 
+    max_depth = sys.getrecursionlimit() - RECURSION_BUFFER
     for n in ns:
-        t_iter = timeit.repeat(lambda: fact_iterative(n), repeat=repeats, number=1)
-        iter_times_ms.append(1000.0 * statistics.median(t_iter))
+        for key, func in BENCH_FUNCS.items():
+            if key in DEPTH_LIMITED and n > max_depth:
+                series[f"{key}_ms"].append(math.nan)
+                continue
+            samples = timeit.repeat(lambda: func(n), repeat=repeats, number=1)
+            series[f"{key}_ms"].append(1000.0 * statistics.median(samples))
+
+    return series
 
-        t_rec = timeit.repeat(lambda: fact_recursive(n), repeat=repeats, number=1)
-        rec_times_ms.append(1000.0 * statistics.median(t_rec))
 
-    return {"n": ns, "iterative_ms": iter_times_ms, "recursive_ms": rec_times_ms}
+def benchmark_cache(
+    queries: int = 300,
+    max_n: int = 5000,
+    step: int = 250,
+    seed: int = 0,
+) -> Dict[str, Dict[str, float]]:
+    """Сравнить FactorialCache с fact_iterative на потоках запросов.
+
+    Поток «random» — случайные n из [0, max_n], «sorted» — те же n
+    по возрастанию. Для каждого потока берётся новый кеш.
+
+    Returns:
+        dict: поток -> {'plain_ms', 'cached_ms', 'speedup', 'hit_rate'}.
+    """
+    rnd = random.Random(seed)
+    stream = [rnd.randint(0, max_n) for _ in range(queries)]
+    report: Dict[str, Dict[str, float]] = {}
+    for name, ns in (("random", stream), ("sorted", sorted(stream))):
+        cache = FactorialCache(step=step)
+        plain = timeit.timeit(lambda: [fact_iterative(n) for n in ns], number=1)
+        cached = timeit.timeit(lambda: [cache.get(n) for n in ns], number=1)
+        report[name] = {
+            "plain_ms": 1000.0 * plain,
+            "cached_ms": 1000.0 * cached,
+            "speedup": plain / cached if cached > 0 else float("inf"),
+            "hit_rate": cache.stats()["hit_rate"],
+        }
+    return report
+
+
+def benchmark_many(count: int = 300, max_n: int = 5000, seed: int = 0) -> Dict[str, float]:
+    """Сравнить fact_many с вызовом fact_iterative для каждого n.
+
+    Returns:
+        dict: 'loop_ms', 'many_ms' и 'speedup'.
+    """
+    rnd = random.Random(seed)
+    ns = [rnd.randint(0, max_n) for _ in range(count)]
+    loop = timeit.timeit(lambda: [fact_iterative(n) for n in ns], number=1)
+    many = timeit.timeit(lambda: fact_many(ns), number=1)
+    return {
+        "loop_ms": 1000.0 * loop,
+        "many_ms": 1000.0 * many,
+        "speedup": loop / many if many > 0 else float("inf"),
+    }
+
+
+def benchmark_mod_log(
+    n: int = 20_000,
+    p: int = 1_000_000_007,
+    count: int = 200,
+    seed: int = 0,
+) -> Dict[str, float]:
+    """Сравнить fact_mod и log_fact с fact_iterative и последующим сведением.
+
+    n! mod p: fact_mod(n, p) против fact_iterative(n) % p;
+    ln(n!): log_fact(ns) против [math.log(fact_iterative(k)) for k in ns]
+    для `count` случайных k из [0, n // 4].
+
+    Returns:
+        dict: 'mod_plain_ms', 'mod_fast_ms', 'log_plain_ms', 'log_fast_ms'.
+    """
+    rnd = random.Random(seed)
+    ns = [rnd.randint(0, n // 4) for _ in range(count)]
+    return {
+        "mod_plain_ms": 1000.0 * timeit.timeit(lambda: fact_iterative(n) % p, number=1),
+        "mod_fast_ms": 1000.0 * timeit.timeit(lambda: fact_mod(n, p), number=1),
+        "log_plain_ms": 1000.0 * timeit.timeit(
+            lambda: [math.log(fact_iterative(k)) for k in ns], number=1),
+        "log_fast_ms": 1000.0 * timeit.timeit(lambda: log_fact(ns), number=1),
+    }
 
 
 def plot_results(series: Dict[str, List[float]], out_path: str = "factorial_benchmark.png") -> str:
@@ -123,11 +667,52 @@ def plot_results(series: Dict[str, List[float]], out_path: str = "factorial_benc
         str: Путь к сохранённому файлу.
     """
     plt.figure()
-    plt.plot(series["n"], series["iterative_ms"], marker="o", label="Итеративная")
-    plt.plot(series["n"], series["recursive_ms"], marker="o", label="Рекурсивная")
+    for key, label in BENCH_LABELS.items():
+        if f"{key}_ms" in series:
+            plt.plot(series["n"], series[f"{key}_ms"], marker="o", label=label)
     plt.xlabel("n (размер входа)")
     plt.ylabel("Время, мс (медиана)")
-    plt.title("Факториал: время — итеративная vs рекурсивная (без raise)")
+    plt.title("Факториал: время выполнения реализаций (без raise)")
+    plt.legend()
+    plt.grid(True, which="both", linestyle="--", alpha=0.4)
+    plt.savefig(out_path, dpi=160, bbox_inches="tight")
+    return out_path
+
+
+def benchmark_parallel(n: int = 300_000, workers: Iterable[int] = (1, 2, 4), repeats: int = 3) -> Dict[str, List[float]]:
+    """Измерить масштабирование fact_parallel по числу процессов.
+
+    Args:
+        n: Аргумент факториала (>= PARALLEL_MIN_N, иначе параллельной ветви нет).
+        workers: Набор чисел процессов.
+        repeats: Повторов на каждую точку.
+
+    Returns:
+        dict: Согласованные списки 'workers', 'ms' (медиана) и 'speedup'
+        (относительно первого значения `workers`).
+    """
+    counts = list(workers)
+    times_ms = [1000.0 * benchmark_single(lambda k, w=w: fact_parallel(k, w), n, repeat=repeats)
+                for w in counts]
+    return {"workers": counts, "ms": times_ms, "speedup": [times_ms[0] / t for t in times_ms]}
+
+
+def plot_scaling(series: Dict[str, List[float]], out_path: str = "factorial_parallel.png") -> str:
+    """Построить график масштабирования fact_parallel и сохранить в PNG.
+
+    Args:
+        series: Результат `benchmark_parallel`.
+        out_path: Путь для сохранения PNG. По умолчанию 'factorial_parallel.png'.
+
+    Returns:
+        str: Путь к сохранённому файлу.
+    """
+    plt.figure()
+    plt.plot(series["workers"], series["speedup"], marker="o", label="fact_parallel")
+    plt.plot(series["workers"], series["workers"], linestyle="--", label="Идеальное ускорение")
+    plt.xlabel("Число процессов")
+    plt.ylabel("Ускорение относительно 1 процесса")
+    plt.title("Факториал: масштабирование по процессам (без raise)")
     plt.legend()
     plt.grid(True, which="both", linestyle="--", alpha=0.4)
     plt.savefig(out_path, dpi=160, bbox_inches="tight")
@@ -142,34 +727,64 @@ def main() -> None:
     печатает таблицу, выполняет «чистый» бенчмарк одного вызова
     и сохраняет график в PNG-файл.
     """
-    # Запас от лимита рекурсии, чтобы избежать RecursionError.
-    buffer = 50
-    max_safe = sys.getrecursionlimit() - buffer
-
-    # Фиксированный набор n для честного сравнения.
-    n_values = [10, 110, 210, 310, 410, 510, 610, 710]
-    n_values = [n for n in n_values if n <= max_safe]
+    # Фиксированный набор n для честного сравнения; fact_recursive меряется
+    # только до лимита рекурсии (дальше — NaN), остальные — на всех n.
+    n_values = [10, 100, 500, 900, 2_000, 5_000, 10_000, 20_000]
 
     # Серийный бенчмарк (медиана по повторам).
-    series = benchmark_series(n_values, repeats=7)
+    series = benchmark_series(n_values, repeats=5)
 
     # Таблица результатов.
-    print("Результаты (медиана по повторам):")
-    print(f"{'n':>6} | {'итеративная, мс':>16} | {'рекурсивная, мс':>16}")
-    print("-" * 47)
-    for n, ti, tr in zip(series["n"], series["iterative_ms"], series["recursive_ms"]):
-        print(f"{n:6d} | {ti:16.3f} | {tr:16.3f}")
-
-    # «Чистый» бенчмарк одного вызова.
-    n0 = 310 if 310 in series["n"] else series["n"][len(series["n"]) // 2]
-    single_iter_ms = 1000.0 * benchmark_single(fact_iterative, n0, repeat=15)
-    single_rec_ms = 1000.0 * benchmark_single(fact_recursive, n0, repeat=15)
+    print("Результаты (медиана по повторам, мс):")
+    print(f"{'n':>6} | " + " | ".join(f"{key:>17}" for key in BENCH_FUNCS))
+    print("-" * (9 + 20 * len(BENCH_FUNCS)))
+    for i, n in enumerate(series["n"]):
+        print(f"{n:6d} | " + " | ".join(f"{series[f'{key}_ms'][i]:17.3f}" for key in BENCH_FUNCS))
+
+    # Быстрые реализации на больших n (рекурсивная сюда не проходит по глубине).
+    print("\nБольшие n (мс, медиана):")
+    print(f"{'n':>8} | {'итеративная':>12} | {'рек. пополам':>12} | {'дв. разбиение':>13} | {'prime swing':>12}")
+    for n in (50_000, 100_000):
+        row = [1000.0 * benchmark_single(f, n, repeat=3)
+               for f in (fact_iterative, fact_recursive_halving, fact_binary_split, fact_prime_swing)]
+        print(f"{n:8d} | {row[0]:12.1f} | {row[1]:12.1f} | {row[2]:13.1f} | {row[3]:12.1f}")
+
+    # Кеш факториалов на потоках запросов.
+    print("\nFactorialCache vs fact_iterative (300 запросов, n <= 5000):")
+    for name, row in benchmark_cache().items():
+        print(f"{name:>7}: без кеша = {row['plain_ms']:.1f} мс, с кешем = {row['cached_ms']:.1f} мс, "
+              f"ускорение = {row['speedup']:.1f}×, попадания = {row['hit_rate']:.0%}")
+
+    # Пакетный расчёт одним проходом.
+    batch = benchmark_many()
+    print(f"\nfact_many vs цикл fact_iterative (300 значений, n <= 5000): "
+          f"{batch['loop_ms']:.1f} мс -> {batch['many_ms']:.1f} мс, ускорение = {batch['speedup']:.1f}×")
+
+    # Режимы без точного n!: по модулю и в логарифмах.
+    modlog = benchmark_mod_log()
+    print("\nБез точного n! (мс):")
+    print(f"  20000! mod (10^9+7): fact_iterative % p = {modlog['mod_plain_ms']:.1f}, "
+          f"fact_mod = {modlog['mod_fast_ms']:.1f}")
+    print(f"  ln(n!) для 200 значений n <= 5000: math.log(fact_iterative) = {modlog['log_plain_ms']:.1f}, "
+          f"log_fact = {modlog['log_fast_ms']:.2f}")
+
+    # «Чистый» бенчмарк одного вызова: рекурсия с глубиной O(log n) против цикла.
+    n0 = series["n"][-1]
+    single_iter_ms = 1000.0 * benchmark_single(fact_iterative, n0, repeat=5)
+    single_rec_ms = 1000.0 * benchmark_single(fact_recursive_halving, n0, repeat=5)
     ratio = (single_rec_ms / single_iter_ms) if single_iter_ms > 0 else float("inf")
 
     print("\nЧистый бенчмарк одного вызова (мс, медиана):")
-    print(f"n = {n0}: итеративная = {single_iter_ms:.3f} мс, рекурсивная = {single_rec_ms:.3f} мс")
+    print(f"n = {n0}: итеративная = {single_iter_ms:.3f} мс, рекурсивная (пополам) = {single_rec_ms:.3f} мс")
     print(f"Отношение (рекурсивная / итеративная) = {ratio:.2f}×")
 
+    # Параллельный факториал: масштабирование по процессам.
+    scaling = benchmark_parallel()
+    print(f"\nfact_parallel, n = 300000 (мс, медиана; ядер: {os.cpu_count()}):")
+    for w, t, sp in zip(scaling["workers"], scaling["ms"], scaling["speedup"]):
+        print(f"  процессов = {w}: {t:.1f} мс, ускорение = {sp:.2f}×")
+    print(f"График масштабирования сохранён: {plot_scaling(scaling)}")
+
     # График.
     out_path = plot_results(series)
     print(f"\nГрафик сохранён: {out_path}")
@@ -0,0 +1,124 @@
+import math
+import random
+import unittest
+
+import numpy as np
+
+from main import (
+    FactorialCache,
+    PARALLEL_MIN_N,
+    fact_binary_split,
+    fact_iterative,
+    fact_many,
+    fact_mod,
+    fact_parallel,
+    fact_prime_swing,
+    fact_recursive,
+    fact_recursive_halving,
+    log_fact,
+)
+
+
+class TestFastFactorials(unittest.TestCase):
+    FUNCS = (fact_iterative, fact_recursive, fact_binary_split, fact_prime_swing)
+
+    def test_match_math_factorial(self):
+        for func in self.FUNCS:
+            for n in list(range(0, 120)) + [255, 256, 257]:
+                self.assertEqual(func(n), math.factorial(n), (func.__name__, n))
+
+    def test_large_n(self):
+        """Быстрые реализации на n, недоступных прямой рекурсии."""
+        expected = math.factorial(20_000)
+        for func in (fact_binary_split, fact_prime_swing):
+            self.assertEqual(func(20_000), expected)
+
+    def test_invalid_input(self):
+        for func in self.FUNCS:
+            for bad in (-1, 2.0, "3", None):
+                self.assertIsNone(func(bad))
+
+
+class TestFactorialCache(unittest.TestCase):
+    def test_random_queries(self):
+        rnd = random.Random(1)
+        cache = FactorialCache(step=50, max_bytes=20_000)
+        for n in [rnd.randint(0, 2000) for _ in range(200)]:
+            self.assertEqual(cache.get(n), math.factorial(n))
+        stats = cache.stats()
+        self.assertLessEqual(stats["bytes"], 20_000)
+        self.assertGreater(stats["hit_rate"], 0.0)
+        self.assertIsNone(cache.get(-1))
+
+
+class TestRecursiveHalving(unittest.TestCase):
+    def test_match_math_factorial(self):
+        for n in list(range(0, 120)) + [255, 256, 257, 20_000]:
+            self.assertEqual(fact_recursive_halving(n), math.factorial(n), n)
+
+    def test_invalid_input(self):
+        for bad in (-1, 2.0, "3", None):
+            self.assertIsNone(fact_recursive_halving(bad))
+
+
+class TestFactParallel(unittest.TestCase):
+    def test_serial_cut_over(self):
+        self.assertEqual(fact_parallel(500, 4), math.factorial(500))
+        self.assertEqual(fact_parallel(0), 1)
+
+    def test_parallel_path(self):
+        self.assertEqual(fact_parallel(PARALLEL_MIN_N + 1, 2), math.factorial(PARALLEL_MIN_N + 1))
+
+    def test_invalid_input(self):
+        for bad in (-1, 2.0, "3", None):
+            self.assertIsNone(fact_parallel(bad))
+        self.assertIsNone(fact_parallel(10, 0))
+        self.assertIsNone(fact_parallel(10, 2.0))
+
+
+class TestFactMany(unittest.TestCase):
+    def test_input_order_and_invalid(self):
+        ns = [5, 3, -1, 5, "x", 0, 10, 2.0]
+        expected = [120, 6, None, 120, None, 1, math.factorial(10), None]
+        self.assertEqual(fact_many(ns), expected)
+        self.assertEqual(fact_many([]), [])
+
+
+class TestFactMod(unittest.TestCase):
+    def test_matches_brute_force(self):
+        for p in (1, 2, 3, 7, 12, 97, 100, 101, 1009):
+            for n in range(0, 130):
+                self.assertEqual(fact_mod(n, p), math.factorial(n) % p, (n, p))
+
+    def test_wilson_branch_for_large_prime(self):
+        p = 100_003
+        for n in (50_002, 60_000, 99_999, 100_002, 100_003):
+            self.assertEqual(fact_mod(n, p), math.factorial(n) % p)
+
+    def test_invalid_input(self):
+        self.assertIsNone(fact_mod(-1, 5))
+        self.assertIsNone(fact_mod(3, 0))
+        self.assertIsNone(fact_mod(3, 2.0))
+
+
+class TestLogFact(unittest.TestCase):
+    def test_matches_lgamma(self):
+        ns = np.arange(0, 3000)
+        np.testing.assert_allclose(log_fact(ns), [math.lgamma(k + 1) for k in range(3000)], rtol=1e-12)
+        self.assertAlmostEqual(log_fact(10 ** 7), math.lgamma(10 ** 7 + 1))
+        self.assertAlmostEqual(log_fact(10 ** 30), math.lgamma(10 ** 30 + 1.0))
+
+    def test_shape_and_scalar(self):
+        self.assertIsInstance(log_fact(5), float)
+        self.assertEqual(log_fact([[1, 2], [3, 4]]).shape, (2, 2))
+
+    def test_invalid_entries_only_become_nan(self):
+        """Некорректные элементы не портят соседние корректные."""
+        for ns in ([3, 2.5], [3, "x"], [3, None], [3, -1]):
+            result = log_fact(ns)
+            self.assertAlmostEqual(result[0], math.log(6))
+            self.assertTrue(math.isnan(result[1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,9 @@
+import mmap
+import struct
+import sys
+from array import array
 from dataclasses import dataclass
-from typing import Any, Callable, Deque, Dict, Optional, Union, Tuple
+from typing import Any, Callable, Deque, Dict, Iterator, List, Literal, Optional, Union, Tuple
 from collections import deque
 
 
@@ -116,10 +120,19 @@ def gen_bin_tree(
     return tree
 
 
+def _node_parts(node: TreeLike) -> Tuple[int, Optional[TreeLike], Optional[TreeLike]]:
+    """Значение и потомки узла (dict или :class: Node)."""
+    if isinstance(node, dict):
+        return node["value"], node["left"], node["right"]
+    return node.value, node.left, node.right
+
+
 def to_dict(tree: Optional[TreeLike]) -> DictTree:
     """Преобразовать дерево к словарному представлению.
 
     Поддерживает оба контейнера (dict и :class: Node) и None.
+    Обход ведётся явным стеком, поэтому глубина дерева не ограничена
+    лимитом рекурсии.
 
     Args
         tree : Optional[TreeLike]
@@ -139,18 +152,278 @@ def to_dict(tree: Optional[TreeLike]) -> DictTree:
     """
     if tree is None:
         return {}
-    if isinstance(tree, dict):
-        return {
-            "value": tree["value"],
-            "left": to_dict(tree["left"]),
-            "right": to_dict(tree["right"]),
-        }
-    return {
-        "value": tree.value,
-        "left": to_dict(tree.left),
-        "right": to_dict(tree.right),
-    }
+    result: DictTree = {}
+    stack = [(tree, result)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        node, out = pop()
+        if isinstance(node, dict):
+            value, left, right = node["value"], node["left"], node["right"]
+        else:
+            value, left, right = node.value, node.left, node.right
+        left_out: DictTree = {}
+        right_out: DictTree = {}
+        out["value"] = value
+        out["left"] = left_out
+        out["right"] = right_out
+        if right is not None:
+            push((right, right_out))
+        if left is not None:
+            push((left, left_out))
+    return result
+
+
+TraversalOrder = Literal["pre", "in", "post", "level"]
+
+
+def _iter_pre(tree: TreeLike) -> Iterator[Any]:
+    stack = [tree]
+    while stack:
+        value, left, right = _node_parts(stack.pop())
+        yield value
+        if right:
+            stack.append(right)
+        if left:
+            stack.append(left)
+
+
+def _iter_in(tree: TreeLike) -> Iterator[Any]:
+    stack: List[TreeLike] = []
+    node: Optional[TreeLike] = tree
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = _node_parts(node)[1]
+        value, _, right = _node_parts(stack.pop())
+        yield value
+        node = right
+
+
+def _iter_post(tree: TreeLike) -> Iterator[Any]:
+    stack = [(tree, False)]
+    while stack:
+        node, expanded = stack.pop()
+        value, left, right = _node_parts(node)
+        if expanded:
+            yield value
+            continue
+        stack.append((node, True))
+        if right:
+            stack.append((right, False))
+        if left:
+            stack.append((left, False))
+
+
+def _iter_level(tree: TreeLike) -> Iterator[Any]:
+    queue = deque([tree])
+    while queue:
+        value, left, right = _node_parts(queue.popleft())
+        yield value
+        if left:
+            queue.append(left)
+        if right:
+            queue.append(right)
+
+
+_TRAVERSALS = {"pre": _iter_pre, "in": _iter_in, "post": _iter_post, "level": _iter_level}
+
+
+def iter_nodes(tree: Optional[TreeLike], order: TraversalOrder = "pre") -> Optional[Iterator[int]]:
+    """Лениво обойти значения узлов дерева без рекурсии.
+
+    Args
+        tree : Optional[TreeLike]
+            Дерево (dict или :class: Node) или None.
+        order : {"pre", "in", "post", "level"}, optional
+            Порядок обхода: прямой, симметричный, обратный или по уровням.
+            По умолчанию "pre".
+
+    Returns
+        Optional[Iterator[int]]
+            Итератор значений узлов или None, если порядок неизвестен.
+            Пустой словарь {} (отсутствующая ветвь в результате to_dict)
+            узлом не считается.
+    """
+    traverse = _TRAVERSALS.get(order)
+    if traverse is None:
+        return None
+    if not tree:
+        return iter(())
+    return traverse(tree)
+
+
+
+# Бинарная сериализация
+
+TREE_MAGIC = b"BTR1"
+_HEADER = struct.Struct("<4sI")   # сигнатура, высота
+_VALUE = struct.Struct("<q")      # значение узла: int64 little-endian
+MAX_PACKED_HEIGHT = 62
+
+
+def _packed_dict_node(value: int, left: Optional[DictTree], right: Optional[DictTree]) -> DictTree:
+    return {"value": value, "left": left, "right": right}
+
+
+# контейнеры materialize: имя -> построитель узла (value, left, right)
+_PACKED_BUILDERS: Dict[str, Callable[[int, Any, Any], TreeLike]] = {
+    "dict": _packed_dict_node,
+    "dataclass": Node,
+}
+
+
+def _level_values(tree: TreeLike) -> Optional[Tuple[int, List[Any]]]:
+    """Высота и значения полного дерева по уровням; None — дерево неполное."""
+    values: List[Any] = []
+    level = [tree]
+    height = 0
+    while level:
+        height += 1
+        if height > MAX_PACKED_HEIGHT:
+            return None
+        children: List[TreeLike] = []
+        for node in level:
+            value, left, right = _node_parts(node)
+            values.append(value)
+            if left and right:
+                children.append(left)
+                children.append(right)
+            elif left or right:
+                return None
+        if children and len(children) != 2 * len(level):
+            return None
+        level = children
+    return height, values
+
+
+def dump_tree(tree: Optional[TreeLike], path: str) -> Optional[int]:
+    """Записать полное дерево в компактный бинарный файл.
 
+    Формат: заголовок (сигнатура TREE_MAGIC, высота uint32), затем
+    2**height - 1 значений int64 little-endian в порядке обхода по уровням.
+    Потомки узла i лежат в позициях 2i+1 и 2i+2, поэтому ссылки не хранятся.
+
+    Args
+        tree : Optional[TreeLike]
+            Дерево (dict или :class: Node).
+        path : str
+            Путь к файлу.
+
+    Returns
+        Optional[int]
+            Размер файла в байтах; None, если дерево пустое или неполное,
+            либо значения не помещаются в int64.
+    """
+    if not tree:
+        return None
+    levels = _level_values(tree)
+    if levels is None:
+        return None
+    height, values = levels
+    try:
+        packed = array("q", values)
+    except (OverflowError, TypeError):
+        return None
+    if sys.byteorder != "little":
+        packed.byteswap()
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(TREE_MAGIC, height))
+        packed.tofile(f)
+    return _HEADER.size + _VALUE.size * len(packed)
+
+
+class PackedTree:
+    """Узел дерева из файла dump_tree: значения читаются из mmap по индексу.
+
+    Навигация (.value, .left, .right) как у Node, но объекты создаются
+    только для посещённых узлов; остальное дерево остаётся в файле.
+
+    Attributes
+        index : int
+            Позиция узла в порядке обхода по уровням (корень — 0).
+        height : int
+            Высота всего дерева.
+    """
+
+    __slots__ = ("_buf", "_size", "index", "height")
+
+    def __init__(self, buf: mmap.mmap, index: int, height: int) -> None:
+        self._buf = buf
+        self._size = (1 << height) - 1
+        self.index = index
+        self.height = height
+
+    @property
+    def value(self) -> int:
+        return _VALUE.unpack_from(self._buf, _HEADER.size + _VALUE.size * self.index)[0]
+
+    def _child(self, index: int) -> Optional["PackedTree"]:
+        return PackedTree(self._buf, index, self.height) if index < self._size else None
+
+    @property
+    def left(self) -> Optional["PackedTree"]:
+        return self._child(2 * self.index + 1)
+
+    @property
+    def right(self) -> Optional["PackedTree"]:
+        return self._child(2 * self.index + 2)
+
+    def __len__(self) -> int:
+        """Число узлов во всём дереве."""
+        return self._size
+
+    def materialize(self, container: str = "dict") -> Optional[TreeLike]:
+        """Построить поддерево этого узла в контейнере из _PACKED_BUILDERS (иначе None).
+
+        Из файла читаются только значения поддерева: на глубине d это отрезок
+        [2^d·(i+1) − 1, 2^d·(i+1) + 2^d − 2] для узла i. Узлы создаются
+        снизу вверх, по уровню за раз.
+        """
+        build = _PACKED_BUILDERS.get(container)
+        if build is None:
+            return None
+        levels: List[array] = []
+        first, count = self.index, 1
+        while first < self._size:
+            start = _HEADER.size + _VALUE.size * first
+            level = array("q")
+            level.frombytes(self._buf[start:start + _VALUE.size * count])
+            if sys.byteorder != "little":
+                level.byteswap()
+            levels.append(level)
+            first, count = 2 * first + 1, 2 * count
+        below = [build(value, None, None) for value in levels[-1]]
+        for level in reversed(levels[:-1]):
+            below = [build(value, below[2 * k], below[2 * k + 1]) for k, value in enumerate(level)]
+        return below[0]
+
+    def close(self) -> None:
+        """Освободить отображение файла; узлы после этого недоступны."""
+        self._buf.close()
+
+    def __repr__(self) -> str:
+        return f"PackedTree(index={self.index}, height={self.height})"
+
+
+def load_tree(path: str) -> Optional[PackedTree]:
+    """Открыть файл dump_tree через mmap без построения объектов.
+
+    Returns
+        Optional[PackedTree]
+            Корень дерева или None, если файла нет или формат не совпадает.
+    """
+    try:
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(buf) >= _HEADER.size:
+        magic, height = _HEADER.unpack_from(buf)
+        if (magic == TREE_MAGIC and 1 <= height <= MAX_PACKED_HEIGHT
+                and len(buf) == _HEADER.size + _VALUE.size * ((1 << height) - 1)):
+            return PackedTree(buf, 0, height)
+    buf.close()
+    return None
 
 if __name__ == "__main__":
     # Демонстрация: вариант 4 (по умолчанию)
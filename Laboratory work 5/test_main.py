@@ -1,7 +1,12 @@
+import os
+import tempfile
 import unittest
 
 from main import (
+    dump_tree,
     gen_bin_tree,
+    iter_nodes,
+    load_tree,
     to_dict,
     Node,
 )
@@ -144,5 +149,90 @@ class TestGenBinTreeVariant4(unittest.TestCase):
         self.assertEqual(self.depth_dict(t), 6)
 
 
+class TestTraversal(unittest.TestCase):
+
+    def test_level_order_matches_expected_levels(self):
+        """Обход по уровням повторяет уровни варианта 4."""
+        self.assertEqual(
+            list(iter_nodes(gen_bin_tree(), "level")),
+            [4, 16, 5, 64, 17, 20, 6, 256, 65, 68, 18, 80, 21, 24, 7],
+        )
+
+    def test_orders_for_both_containers(self):
+        """Порядки обхода совпадают для dict и dataclass."""
+        t = gen_bin_tree(height=3)
+        t_dc = gen_bin_tree(height=3, container="dataclass")
+        expected = {
+            "pre": [4, 16, 64, 17, 5, 20, 6],
+            "in": [64, 16, 17, 4, 20, 5, 6],
+            "post": [64, 17, 16, 20, 6, 5, 4],
+        }
+        for order, values in expected.items():
+            self.assertEqual(list(iter_nodes(t, order)), values)
+            self.assertEqual(list(iter_nodes(t_dc, order)), values)
+
+    def test_unknown_order(self):
+        self.assertIsNone(iter_nodes(gen_bin_tree(), "zigzag"))
+
+    def test_deep_degenerate_tree(self):
+        """Глубина больше лимита рекурсии: to_dict и обход без RecursionError."""
+        depth = 50_000
+        root = Node(0)
+        node = root
+        for value in range(1, depth):
+            node.right = Node(value)
+            node = node.right
+        as_dict = to_dict(root)
+        self.assertEqual(as_dict["right"]["value"], 1)
+        self.assertEqual(sum(1 for _ in iter_nodes(as_dict, "in")), depth)
+        self.assertEqual(sum(1 for _ in iter_nodes(root, "level")), depth)
+
+
+class TestBinaryFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "tree.bin")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_roundtrip_both_containers(self):
+        for container in ("dict", "dataclass"):
+            tree = gen_bin_tree(height=6, container=container)
+            self.assertEqual(dump_tree(tree, self.path), 8 + 8 * 63)
+            packed = load_tree(self.path)
+            self.assertEqual(to_dict(packed), to_dict(tree))
+            self.assertEqual(packed.materialize(container), tree)
+            self.assertEqual(to_dict(packed.left.materialize()), to_dict(tree)["left"])
+            packed.close()
+
+    def test_materialize_subtree_only(self):
+        """materialize строит только поддерево узла: лист — один узел."""
+        tree = gen_bin_tree(height=6)
+        dump_tree(tree, self.path)
+        packed = load_tree(self.path)
+        leaf = packed
+        while leaf.left is not None:
+            leaf = leaf.left
+        self.assertEqual(leaf.materialize(), {"value": 4 ** 6, "left": None, "right": None})
+        self.assertEqual(packed.right.left.materialize(), tree["right"]["left"])
+        self.assertIsNone(packed.materialize("unknown"))
+        packed.close()
+
+    def test_rejects_unpackable_trees(self):
+        partial = gen_bin_tree(height=3)
+        partial["left"]["left"] = None
+        self.assertIsNone(dump_tree(partial, self.path))
+        self.assertIsNone(dump_tree(gen_bin_tree(height=2, root=2 ** 62), self.path))
+        self.assertIsNone(dump_tree(None, self.path))
+
+    def test_rejects_bad_files(self):
+        self.assertIsNone(load_tree(os.path.join(self.tmp.name, "missing.bin")))
+        with open(self.path, "wb") as f:
+            f.write(b"BTR1")
+        self.assertIsNone(load_tree(self.path))
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
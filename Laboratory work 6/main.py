@@ -1,6 +1,13 @@
 from dataclasses import dataclass
-from typing import Any, Callable, Deque, Dict, Optional, Tuple, Union, Iterable, List
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Union, Iterable, Iterator, List, Literal
 from collections import deque
+from array import array
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
 import timeit
 import statistics as stats
 import matplotlib.pyplot as plt
@@ -45,26 +52,137 @@ def make_node_dict(val: int) -> DictTree:
     return {"value": val, "left": None, "right": None}
 
 
+def _node_parts(node: TreeLike) -> Tuple[Any, Optional[TreeLike], Optional[TreeLike]]:
+    """Значение и потомки узла (dict или Node)."""
+    if isinstance(node, dict):
+        return node.get("value"), node.get("left"), node.get("right")
+    return node.value, node.left, node.right
+
+
 def to_dict(tree: Optional[TreeLike]) -> DictTree:
     """Преобразовать дерево к словарному представлению.
 
     Работает и для dict, и для dataclass Node, и для None (возвращает пустой словарь).
+    Обход ведётся явным стеком: глубина дерева не ограничена лимитом рекурсии,
+    и на каждый узел не тратится вызов функции.
     """
+    if tree is None:
+        return {}
+    result: DictTree = {}
+    stack = [(tree, result)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        node, out = pop()
+        if isinstance(node, dict):
+            value, left, right = node.get("value"), node.get("left"), node.get("right")
+        else:
+            value, left, right = node.value, node.left, node.right
+        left_out: DictTree = {}
+        right_out: DictTree = {}
+        out["value"] = value
+        out["left"] = left_out
+        out["right"] = right_out
+        if right is not None:
+            push((right, right_out))
+        if left is not None:
+            push((left, left_out))
+    return result
+
+
+def _to_dict_recursive(tree: Optional[TreeLike]) -> DictTree:
+    """Рекурсивный to_dict (эталон для сравнения в benchmark_to_dict)."""
     if tree is None:
         return {}
     if isinstance(tree, dict):
         return {
             "value": tree.get("value"),
-            "left": to_dict(tree.get("left")),
-            "right": to_dict(tree.get("right")),
+            "left": _to_dict_recursive(tree.get("left")),
+            "right": _to_dict_recursive(tree.get("right")),
         }
     return {
         "value": tree.value,
-        "left": to_dict(tree.left),
-        "right": to_dict(tree.right),
+        "left": _to_dict_recursive(tree.left),
+        "right": _to_dict_recursive(tree.right),
     }
 
 
+# Обходы
+
+TraversalOrder = Literal["pre", "in", "post", "level"]
+
+
+def _iter_pre(tree: TreeLike) -> Iterator[Any]:
+    stack = [tree]
+    while stack:
+        value, left, right = _node_parts(stack.pop())
+        yield value
+        if right:
+            stack.append(right)
+        if left:
+            stack.append(left)
+
+
+def _iter_in(tree: TreeLike) -> Iterator[Any]:
+    stack: List[TreeLike] = []
+    node: Optional[TreeLike] = tree
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = _node_parts(node)[1]
+        value, _, right = _node_parts(stack.pop())
+        yield value
+        node = right
+
+
+def _iter_post(tree: TreeLike) -> Iterator[Any]:
+    stack = [(tree, False)]
+    while stack:
+        node, expanded = stack.pop()
+        value, left, right = _node_parts(node)
+        if expanded:
+            yield value
+            continue
+        stack.append((node, True))
+        if right:
+            stack.append((right, False))
+        if left:
+            stack.append((left, False))
+
+
+def _iter_level(tree: TreeLike) -> Iterator[Any]:
+    queue = deque([tree])
+    while queue:
+        value, left, right = _node_parts(queue.popleft())
+        yield value
+        if left:
+            queue.append(left)
+        if right:
+            queue.append(right)
+
+
+_TRAVERSALS = {"pre": _iter_pre, "in": _iter_in, "post": _iter_post, "level": _iter_level}
+
+
+def iter_nodes(tree: Optional[TreeLike], order: TraversalOrder = "pre") -> Optional[Iterator[Any]]:
+    """Лениво обойти значения узлов дерева без рекурсии.
+
+    Args:
+        tree: Дерево (dict или Node) или None.
+        order: Порядок обхода: "pre", "in", "post" или "level".
+
+    Returns:
+        Итератор значений узлов или None, если порядок неизвестен.
+        Пустой словарь {} (отсутствующая ветвь в результате to_dict)
+        узлом не считается.
+    """
+    traverse = _TRAVERSALS.get(order)
+    if traverse is None:
+        return None
+    if not tree:
+        return iter(())
+    return traverse(tree)
+
+
 # Рекурсивная генерация
 
 def build_tree_recursive(
@@ -198,6 +316,173 @@ def build_tree_iterative(
     return tree
 
 
+# Бинарная сериализация
+
+TREE_MAGIC = b"BTR1"
+_HEADER = struct.Struct("<4sI")   # сигнатура, высота
+_VALUE = struct.Struct("<q")      # значение узла: int64 little-endian
+MAX_PACKED_HEIGHT = 62
+
+
+def _packed_dict_node(value: int, left: Optional[DictTree], right: Optional[DictTree]) -> DictTree:
+    return {"value": value, "left": left, "right": right}
+
+
+# контейнеры materialize: имя -> построитель узла (value, left, right)
+_PACKED_BUILDERS: Dict[str, Callable[[int, Any, Any], TreeLike]] = {
+    "dict": _packed_dict_node,
+    "dataclass": Node,
+}
+
+
+def _level_values(tree: TreeLike) -> Optional[Tuple[int, List[Any]]]:
+    """Высота и значения полного дерева по уровням; None — дерево неполное."""
+    values: List[Any] = []
+    level = [tree]
+    height = 0
+    while level:
+        height += 1
+        if height > MAX_PACKED_HEIGHT:
+            return None
+        children: List[TreeLike] = []
+        for node in level:
+            value, left, right = _node_parts(node)
+            values.append(value)
+            if left and right:
+                children.append(left)
+                children.append(right)
+            elif left or right:
+                return None
+        if children and len(children) != 2 * len(level):
+            return None
+        level = children
+    return height, values
+
+
+def dump_tree(tree: Optional[TreeLike], path: str) -> Optional[int]:
+    """Записать полное дерево в компактный бинарный файл.
+
+    Формат: заголовок (сигнатура TREE_MAGIC, высота uint32), затем
+    2**height - 1 значений int64 little-endian в порядке обхода по уровням.
+    Потомки узла i лежат в позициях 2i+1 и 2i+2, поэтому ссылки не хранятся.
+
+    Args:
+        tree: Дерево (dict или Node).
+        path: Путь к файлу.
+
+    Returns:
+        Размер файла в байтах; None, если дерево пустое или неполное,
+        либо значения не помещаются в int64.
+    """
+    if not tree:
+        return None
+    levels = _level_values(tree)
+    if levels is None:
+        return None
+    height, values = levels
+    try:
+        packed = array("q", values)
+    except (OverflowError, TypeError):
+        return None
+    if sys.byteorder != "little":
+        packed.byteswap()
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(TREE_MAGIC, height))
+        packed.tofile(f)
+    return _HEADER.size + _VALUE.size * len(packed)
+
+
+class PackedTree:
+    """Узел дерева из файла dump_tree: значения читаются из mmap по индексу.
+
+    Навигация (.value, .left, .right) как у Node, но объекты создаются
+    только для посещённых узлов; остальное дерево остаётся в файле.
+
+    Attributes:
+        index: Позиция узла в порядке обхода по уровням (корень — 0).
+        height: Высота всего дерева.
+    """
+
+    __slots__ = ("_buf", "_size", "index", "height")
+
+    def __init__(self, buf: mmap.mmap, index: int, height: int) -> None:
+        self._buf = buf
+        self._size = (1 << height) - 1
+        self.index = index
+        self.height = height
+
+    @property
+    def value(self) -> int:
+        return _VALUE.unpack_from(self._buf, _HEADER.size + _VALUE.size * self.index)[0]
+
+    def _child(self, index: int) -> Optional["PackedTree"]:
+        return PackedTree(self._buf, index, self.height) if index < self._size else None
+
+    @property
+    def left(self) -> Optional["PackedTree"]:
+        return self._child(2 * self.index + 1)
+
+    @property
+    def right(self) -> Optional["PackedTree"]:
+        return self._child(2 * self.index + 2)
+
+    def __len__(self) -> int:
+        """Число узлов во всём дереве."""
+        return self._size
+
+    def materialize(self, container: str = "dict") -> Optional[TreeLike]:
+        """Построить поддерево этого узла в контейнере из _PACKED_BUILDERS (иначе None).
+
+        Из файла читаются только значения поддерева: на глубине d это отрезок
+        [2^d·(i+1) − 1, 2^d·(i+1) + 2^d − 2] для узла i. Узлы создаются
+        снизу вверх, по уровню за раз.
+        """
+        build = _PACKED_BUILDERS.get(container)
+        if build is None:
+            return None
+        levels: List[array] = []
+        first, count = self.index, 1
+        while first < self._size:
+            start = _HEADER.size + _VALUE.size * first
+            level = array("q")
+            level.frombytes(self._buf[start:start + _VALUE.size * count])
+            if sys.byteorder != "little":
+                level.byteswap()
+            levels.append(level)
+            first, count = 2 * first + 1, 2 * count
+        below = [build(value, None, None) for value in levels[-1]]
+        for level in reversed(levels[:-1]):
+            below = [build(value, below[2 * k], below[2 * k + 1]) for k, value in enumerate(level)]
+        return below[0]
+
+    def close(self) -> None:
+        """Освободить отображение файла; узлы после этого недоступны."""
+        self._buf.close()
+
+    def __repr__(self) -> str:
+        return f"PackedTree(index={self.index}, height={self.height})"
+
+
+def load_tree(path: str) -> Optional[PackedTree]:
+    """Открыть файл dump_tree через mmap без построения объектов.
+
+    Returns:
+        Корень PackedTree или None, если файла нет или формат не совпадает.
+    """
+    try:
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(buf) >= _HEADER.size:
+        magic, height = _HEADER.unpack_from(buf)
+        if (magic == TREE_MAGIC and 1 <= height <= MAX_PACKED_HEIGHT
+                and len(buf) == _HEADER.size + _VALUE.size * ((1 << height) - 1)):
+            return PackedTree(buf, 0, height)
+    buf.close()
+    return None
+
+
 # Бенчмарк и график
 
 def benchmark_series(
@@ -257,6 +542,112 @@ def benchmark_series(
     return {"height": hts, "iter_ms": iter_ms, "rec_ms": rec_ms}
 
 
+def benchmark_to_dict(
+    heights: Iterable[int] = range(10, 23, 2),
+    repeats: int = 3,
+    *,
+    container: str = "dict",
+) -> Dict[str, List[float]]:
+    """Сравнить пропускную способность рекурсивного и итеративного to_dict.
+
+    Для каждой высоты строит полное дерево один раз и измеряет медиану времени
+    преобразования обеими реализациями.
+
+    Args:
+        heights: Набор высот (по умолчанию 10, 12, ..., 22).
+        repeats: Сколько раз повторять измерение для каждой точки.
+        container: Тип контейнера исходного дерева ("dict" | "dataclass").
+
+    Returns:
+        Словарь со списками одинаковой длины:
+        {
+          "height": [...],
+          "iter_nodes_per_s": [...],
+          "rec_nodes_per_s":  [...],
+        }
+    """
+    hts = list(heights)
+    iter_rate: List[float] = []
+    rec_rate: List[float] = []
+
+    for h in hts:
+        tree = build_tree_iterative(height=h, container=container)
+        nodes = 2 ** h - 1
+        t_iter = stats.median(timeit.repeat(lambda: to_dict(tree), repeat=repeats, number=1))
+        t_rec = stats.median(timeit.repeat(lambda: _to_dict_recursive(tree), repeat=repeats, number=1))
+        iter_rate.append(nodes / t_iter)
+        rec_rate.append(nodes / t_rec)
+        del tree
+
+    return {"height": hts, "iter_nodes_per_s": iter_rate, "rec_nodes_per_s": rec_rate}
+
+
+def benchmark_serialization(
+    heights: Iterable[int] = (16, 18, 20),
+    repeats: int = 3,
+) -> Dict[str, List[float]]:
+    """Сравнить бинарный формат dump_tree/load_tree с json.dumps(to_dict(tree)).
+
+    Для каждой высоты оба формата пишутся в файл и читаются обратно:
+    кодирование — дерево -> файл, декодирование — файл -> словарное дерево
+    (json.load или load_tree + materialize); отдельно замеряется ленивое
+    открытие load_tree с чтением одного листа.
+
+    Args:
+        heights: Набор высот.
+        repeats: Сколько раз повторять измерение для каждой точки.
+
+    Returns:
+        Словарь со списками одинаковой длины: "height", "json_bytes",
+        "bin_bytes", "json_enc_ms", "bin_enc_ms", "json_dec_ms",
+        "bin_dec_ms", "bin_open_ms".
+    """
+    keys = ("json_bytes", "bin_bytes", "json_enc_ms", "bin_enc_ms",
+            "json_dec_ms", "bin_dec_ms", "bin_open_ms")
+    out: Dict[str, List[float]] = {"height": list(heights), **{k: [] for k in keys}}
+
+    def median_ms(func: Callable[[], Any]) -> float:
+        return 1000.0 * stats.median(timeit.repeat(func, repeat=repeats, number=1))
+
+    def write_json(tree: TreeLike, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(to_dict(tree)))
+
+    def read_json(path: str) -> DictTree:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def read_bin(path: str) -> Optional[TreeLike]:
+        packed = load_tree(path)
+        tree = packed.materialize()
+        packed.close()
+        return tree
+
+    def open_bin(path: str) -> int:
+        packed = load_tree(path)
+        node = packed
+        while node.left is not None:
+            node = node.left
+        value = node.value
+        packed.close()
+        return value
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "tree.json")
+        bin_path = os.path.join(tmp, "tree.bin")
+        for h in out["height"]:
+            tree = build_tree_iterative(height=h)
+            out["json_enc_ms"].append(median_ms(lambda: write_json(tree, json_path)))
+            out["bin_enc_ms"].append(median_ms(lambda: dump_tree(tree, bin_path)))
+            del tree
+            out["json_bytes"].append(os.path.getsize(json_path))
+            out["bin_bytes"].append(os.path.getsize(bin_path))
+            out["json_dec_ms"].append(median_ms(lambda: read_json(json_path)))
+            out["bin_dec_ms"].append(median_ms(lambda: read_bin(bin_path)))
+            out["bin_open_ms"].append(median_ms(lambda: open_bin(bin_path)))
+    return out
+
+
 def plot_results(series: Dict[str, List[float]], out_path: str = "btree_benchmark.png") -> str:
     """Построить график: высота vs время (мс)."""
     plt.figure()
@@ -298,6 +689,25 @@ def main() -> None:
     print(f"h = {h0}: нерекурсивная = {iter_one:.3f} мс, рекурсивная = {rec_one:.3f} мс")
     print(f"Отношение (рекурсивная / нерекурсивная) = {ratio:.2f}×")
 
+    # to_dict: рекурсивный vs итеративный (высоты 20–22 требуют нескольких ГБ памяти)
+    conv = benchmark_to_dict(range(10, 19, 2))
+    print("\nto_dict, узлов в секунду (медиана):")
+    print(f"{'h':>3} | {'итеративный':>12} | {'рекурсивный':>12}")
+    print("-" * 33)
+    for h, ri, rr in zip(conv["height"], conv["iter_nodes_per_s"], conv["rec_nodes_per_s"]):
+        print(f"{h:3d} | {ri:12.0f} | {rr:12.0f}")
+
+    # Сериализация: JSON vs бинарный формат
+    ser = benchmark_serialization((14, 16, 18))
+    print("\nСериализация (медиана, мс; размер, КБ):")
+    print(f"{'h':>3} | {'json КБ':>9} | {'bin КБ':>8} | {'json enc':>8} | {'bin enc':>8} | "
+          f"{'json dec':>8} | {'bin dec':>8} | {'bin open':>8}")
+    print("-" * 83)
+    for i, h in enumerate(ser["height"]):
+        print(f"{h:3d} | {ser['json_bytes'][i] / 1024:9.1f} | {ser['bin_bytes'][i] / 1024:8.1f} | "
+              f"{ser['json_enc_ms'][i]:8.2f} | {ser['bin_enc_ms'][i]:8.2f} | "
+              f"{ser['json_dec_ms'][i]:8.2f} | {ser['bin_dec_ms'][i]:8.2f} | {ser['bin_open_ms'][i]:8.3f}")
+
     # График
     out = plot_results(series)
     print(f"\nГрафик сохранён: {out}")
@@ -0,0 +1,77 @@
+import unittest
+
+from main import (
+    Node,
+    _to_dict_recursive,
+    build_tree_iterative,
+    build_tree_recursive,
+    iter_nodes,
+    to_dict,
+)
+
+
+class TestToDict(unittest.TestCase):
+
+    def test_matches_recursive_version(self):
+        """Итеративный to_dict совпадает с рекурсивным для обоих контейнеров."""
+        for container in ("dict", "dataclass"):
+            for height in (1, 2, 5):
+                tree = build_tree_iterative(height=height, container=container)
+                self.assertEqual(to_dict(tree), _to_dict_recursive(tree))
+
+    def test_builders_agree(self):
+        for container in ("dict", "dataclass"):
+            self.assertEqual(
+                to_dict(build_tree_iterative(height=4, container=container)),
+                to_dict(build_tree_recursive(height=4, container=container)),
+            )
+
+    def test_empty_inputs(self):
+        """None — пустое дерево, а {} — узел без значения, как в рекурсивной версии."""
+        self.assertEqual(to_dict(None), {})
+        self.assertEqual(to_dict({}), {"value": None, "left": {}, "right": {}})
+        self.assertEqual(to_dict({}), _to_dict_recursive({}))
+
+
+class TestTraversal(unittest.TestCase):
+
+    def test_level_order_matches_expected_levels(self):
+        """Обход по уровням повторяет уровни варианта 4."""
+        self.assertEqual(
+            list(iter_nodes(build_tree_iterative(), "level")),
+            [4, 16, 5, 64, 17, 20, 6, 256, 65, 68, 18, 80, 21, 24, 7],
+        )
+
+    def test_orders_for_both_containers(self):
+        """Порядки обхода совпадают для dict и dataclass."""
+        t = build_tree_iterative(height=3)
+        t_dc = build_tree_iterative(height=3, container="dataclass")
+        expected = {
+            "pre": [4, 16, 64, 17, 5, 20, 6],
+            "in": [64, 16, 17, 4, 20, 5, 6],
+            "post": [64, 17, 16, 20, 6, 5, 4],
+        }
+        for order, values in expected.items():
+            self.assertEqual(list(iter_nodes(t, order)), values)
+            self.assertEqual(list(iter_nodes(t_dc, order)), values)
+            self.assertEqual(list(iter_nodes(to_dict(t_dc), order)), values)
+
+    def test_unknown_order(self):
+        self.assertIsNone(iter_nodes(build_tree_iterative(), "zigzag"))
+
+    def test_deep_degenerate_tree(self):
+        """Глубина больше лимита рекурсии: to_dict и обход без RecursionError."""
+        depth = 50_000
+        root = Node(0)
+        node = root
+        for value in range(1, depth):
+            node.right = Node(value)
+            node = node.right
+        as_dict = to_dict(root)
+        self.assertEqual(as_dict["right"]["value"], 1)
+        self.assertEqual(sum(1 for _ in iter_nodes(as_dict, "in")), depth)
+        self.assertEqual(sum(1 for _ in iter_nodes(root, "level")), depth)
+
+
+if __name__ == "__main__":
+    unittest.main()